@@ -69,6 +69,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -87,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -132,6 +133,14 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# The platforms imported during startup are recorded so they can be
+# imported ahead of the setup of their integration on the next start.
+STARTUP_PLATFORMS_STORAGE_KEY = "core.startup_platforms"
+STARTUP_PLATFORMS_STORAGE_VERSION = 1
+# Delay saving so the platforms of integrations that finish their
+# setup shortly after startup are recorded as well
+STARTUP_PLATFORMS_SAVE_DELAY = 300
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -434,6 +443,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_compiled_templates(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -965,6 +975,41 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+@core.callback
+def _async_startup_platforms_to_save(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the platforms that have been imported, in import order."""
+    platforms: dict[str, list[str]] = {}
+    for name in hass.data[loader.DATA_COMPONENTS]:
+        domain, _, platform_name = name.partition(".")
+        if platform_name:
+            platforms.setdefault(domain, []).append(platform_name)
+    return {"ha_version": __version__, "platforms": platforms}
+
+
+async def _async_preload_startup_platforms(
+    store: Store[dict[str, Any]], integration_cache: dict[str, loader.Integration]
+) -> None:
+    """Import the platforms that were imported during the previous start.
+
+    The platforms are imported one integration at a time so the
+    import executor does not get flooded ahead of the imports of
+    the integrations that are being set up.
+    """
+    if not (data := await store.async_load()) or data.get("ha_version") != __version__:
+        return
+    platforms: dict[str, list[str]] = data["platforms"]
+    for domain, platform_names in platforms.items():
+        if (
+            (integration := integration_cache.get(domain)) is None
+            or integration.platforms_are_loaded(platform_names)
+            or not (existing := integration.platforms_exists(platform_names))
+        ):
+            continue
+        # Errors are reported when the integration imports them again
+        with contextlib.suppress(ImportError):
+            await integration.async_get_platforms(existing)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -976,6 +1021,18 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    startup_platforms_store: Store[dict[str, Any]] = Store(
+        hass,
+        STARTUP_PLATFORMS_STORAGE_VERSION,
+        STARTUP_PLATFORMS_STORAGE_KEY,
+        private=True,
+    )
+    hass.async_create_background_task(
+        _async_preload_startup_platforms(startup_platforms_store, integration_cache),
+        "preload platforms",
+        eager_start=True,
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1068,6 +1125,14 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    # Platforms imported while in recovery or safe mode are not the
+    # ones that will be needed on the next start
+    if not hass.config.recovery_mode and not hass.config.safe_mode:
+        startup_platforms_store.async_delay_save(
+            partial(_async_startup_platforms_to_save, hass),
+            STARTUP_PLATFORMS_SAVE_DELAY,
+        )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
@@ -25,6 +25,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
 from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .util import create_compressed_inner_tar
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
@@ -279,8 +280,8 @@ class BackupManager(BaseBackupManager):
             tar_info.size = len(raw_bytes)
             tar_info.mtime = int(time.time())
             outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
+            with create_compressed_inner_tar(
+                outer_secure_tarfile_tarfile, "./homeassistant.tar.gz"
             ) as core_tar:
                 atomic_contents_add(
                     tar_file=core_tar,
@@ -0,0 +1,114 @@
+"""Utilities for the Backup integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import gzip
+import os
+import tarfile
+import time
+from typing import IO
+
+# Size of the chunks that are compressed into separate gzip members
+COMPRESS_CHUNK_SIZE = 2**20 * 4  # 4MB
+
+# Same compression level securetar uses for inner tar files
+COMPRESS_LEVEL = 6
+
+MAX_COMPRESS_WORKERS = 4
+
+
+class ParallelGzipWriter:
+    """Write data as gzip members compressed on a thread pool.
+
+    Concatenated gzip members are a valid gzip stream, so the
+    result can be read like any other gzip file. zlib releases the
+    GIL while compressing, which lets the chunks be compressed on
+    multiple cores while the tar file is being read from disk.
+    """
+
+    def __init__(
+        self, fileobj: IO[bytes], executor: ThreadPoolExecutor, max_pending: int
+    ) -> None:
+        """Initialize the writer."""
+        self._fileobj = fileobj
+        self._executor = executor
+        self._max_pending = max_pending
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+
+    def write(self, data: bytes) -> int:
+        """Buffer data and compress every full chunk."""
+        buffer = self._buffer
+        buffer += data
+        while len(buffer) >= COMPRESS_CHUNK_SIZE:
+            self._submit(bytes(buffer[:COMPRESS_CHUNK_SIZE]))
+            del buffer[:COMPRESS_CHUNK_SIZE]
+        return len(data)
+
+    def flush(self) -> None:
+        """Compress the buffered data and write all pending members."""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def _submit(self, chunk: bytes) -> None:
+        """Compress a chunk on the thread pool."""
+        self._pending.append(
+            self._executor.submit(gzip.compress, chunk, COMPRESS_LEVEL, mtime=0)
+        )
+        # Members are written in order as soon as they are needed to
+        # keep the number of chunks held in memory bounded.
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+@contextmanager
+def create_compressed_inner_tar(
+    outer_tar: tarfile.TarFile, name: str
+) -> Generator[tarfile.TarFile]:
+    """Add a gzip compressed tar file to an uncompressed outer tar file.
+
+    This works like SecureTarFile.create_inner_tar, but the inner tar file
+    is compressed on multiple threads. The header of the inner tar file is
+    written with a placeholder size that is updated once the size of the
+    compressed data is known.
+    """
+    fileobj = outer_tar.fileobj
+    assert fileobj is not None
+    tar_info = tarfile.TarInfo(name=name)
+    # A float mtime forces a PAX header, which is needed
+    # to store the size of inner tar files larger than 8GB
+    tar_info.mtime = time.time()
+    header_start = fileobj.tell()
+    header = tar_info.tobuf(outer_tar.format, outer_tar.encoding, outer_tar.errors)
+    fileobj.write(header)
+
+    workers = min(os.cpu_count() or 1, MAX_COMPRESS_WORKERS)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="backup_compress"
+    ) as executor:
+        writer = ParallelGzipWriter(fileobj, executor, workers * 2)
+        with tarfile.open(
+            mode="w|", fileobj=writer, bufsize=COMPRESS_CHUNK_SIZE
+        ) as inner_tar:
+            yield inner_tar
+        writer.flush()
+
+    data_end = fileobj.tell()
+    tar_info.size = data_end - header_start - len(header)
+    if remainder := tar_info.size % tarfile.BLOCKSIZE:
+        fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+    padded_end = fileobj.tell()
+    outer_tar.offset += padded_end - data_end + tar_info.size
+    fileobj.seek(header_start)
+    outer_tar.addfile(tar_info)
+    # The header with the real size must exactly replace the placeholder
+    # or it would overwrite the start of the compressed data
+    assert fileobj.tell() - header_start == len(header)
+    fileobj.seek(padded_end)
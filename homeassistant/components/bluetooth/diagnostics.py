@@ -22,6 +22,7 @@ async def async_get_config_entry_diagnostics(
     adapters = await manager.async_get_bluetooth_adapters()
     diagnostics = {
         "manager": manager_diagnostics,
+        "discovery": manager.async_discovery_diagnostics(),
         "adapters": adapters,
     }
     if platform.system() == "Linux":
@@ -6,6 +6,8 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+import time
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -49,6 +51,10 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "_integration_matcher",
         "_callback_index",
         "_cancel_logging_listener",
+        "_advertisements",
+        "_matcher_time",
+        "_callbacks_invoked",
+        "_stats_start",
     )
 
     def __init__(
@@ -65,6 +71,10 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
+        self._advertisements = 0
+        self._matcher_time = 0.0
+        self._callbacks_invoked = 0
+        self._stats_start = time.monotonic()
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
 
@@ -102,7 +112,12 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._async_trigger_matching_discovery(service_info)
 
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        start = time.perf_counter()
         matched_domains = self._integration_matcher.match_domains(service_info)
+        callback_matches = self._callback_index.match_callbacks(service_info)
+        self._matcher_time += time.perf_counter() - start
+        self._advertisements += 1
+        self._callbacks_invoked += len(callback_matches)
         if self._debug:
             _LOGGER.debug(
                 "%s: %s match: %s",
@@ -111,7 +126,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 matched_domains,
             )
 
-        for match in self._callback_index.match_callbacks(service_info):
+        for match in callback_matches:
             callback = match[CALLBACK]
             try:
                 callback(service_info, BluetoothChange.ADVERTISEMENT)
@@ -135,6 +150,22 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 discovery_key=discovery_key,
             )
 
+    @hass_callback
+    def async_discovery_diagnostics(self) -> dict[str, Any]:
+        """Return statistics about advertisement processing."""
+        elapsed = time.monotonic() - self._stats_start
+        integration_matcher = self._integration_matcher
+        return {
+            "advertisements": self._advertisements,
+            "advertisements_per_second": round(
+                self._advertisements / elapsed if elapsed else 0.0, 2
+            ),
+            "matcher_time": round(self._matcher_time, 6),
+            "callbacks_invoked": self._callbacks_invoked,
+            "integration_matcher_cache_hits": integration_matcher.cache_hits,
+            "integration_matcher_cache_misses": integration_matcher.cache_misses,
+        }
+
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
@@ -89,10 +89,28 @@ def seen_all_fields(
     return True
 
 
+type _MatchKey = tuple[
+    bool,
+    str,
+    tuple[str, ...],
+    tuple[str, ...],
+    tuple[tuple[int, bytes | None], ...],
+]
+
+
 class IntegrationMatcher:
     """Integration matcher for the bluetooth integration."""
 
-    __slots__ = ("_integration_matchers", "_matched", "_matched_connectable", "_index")
+    __slots__ = (
+        "_integration_matchers",
+        "_matched",
+        "_matched_connectable",
+        "_index",
+        "_match_cache",
+        "_manufacturer_data_start_ids",
+        "cache_hits",
+        "cache_misses",
+    )
 
     def __init__(self, integration_matchers: list[BluetoothMatcher]) -> None:
         """Initialize the matcher."""
@@ -104,18 +122,73 @@ class IntegrationMatcher:
             MAX_REMEMBER_ADDRESSES
         )
         self._index = BluetoothMatcherIndex()
+        # The domains the index matched for the last advertisement
+        # content seen from each address.
+        self._match_cache: LRU[str, tuple[_MatchKey, frozenset[str]]] = LRU(
+            MAX_REMEMBER_ADDRESSES
+        )
+        self._manufacturer_data_start_ids: set[int] = set()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     @callback
     def async_setup(self) -> None:
         """Set up the matcher."""
         for matcher in self._integration_matchers:
             self._index.add(matcher)
+            if MANUFACTURER_DATA_START in matcher:
+                self._manufacturer_data_start_ids.add(matcher[MANUFACTURER_ID])
         self._index.build()
 
     def async_clear_address(self, address: str) -> None:
         """Clear the history matches for a set of domains."""
         self._matched.pop(address, None)
         self._matched_connectable.pop(address, None)
+        self._match_cache.pop(address, None)
+
+    def _match_key(self, service_info: BluetoothServiceInfoBleak) -> _MatchKey:
+        """Return the advertisement content the matchers can look at.
+
+        Manufacturer data changes often, but the bytes only
+        matter for the manufacturer ids that have a matcher
+        checking the start of the data.
+        """
+        data_start_ids = self._manufacturer_data_start_ids
+        return (
+            service_info.connectable,
+            service_info.name,
+            tuple(service_info.service_uuids),
+            tuple(service_info.service_data),
+            tuple(
+                [
+                    (
+                        manufacturer_id,
+                        data if manufacturer_id in data_start_ids else None,
+                    )
+                    for manufacturer_id, data in service_info.manufacturer_data.items()
+                ]
+            ),
+        )
+
+    def _match_index_domains(
+        self, service_info: BluetoothServiceInfoBleak
+    ) -> frozenset[str]:
+        """Return the domains the index matches, reusing the last result.
+
+        The result is reused until the content of the
+        advertisement from the address changes.
+        """
+        address = service_info.address
+        key = self._match_key(service_info)
+        if (cached := self._match_cache.get(address)) is not None and cached[0] == key:
+            self.cache_hits += 1
+            return cached[1]
+        self.cache_misses += 1
+        domains = frozenset(
+            [matcher[DOMAIN] for matcher in self._index.match(service_info)]
+        )
+        self._match_cache[address] = (key, domains)
+        return domains
 
     def match_domains(self, service_info: BluetoothServiceInfoBleak) -> set[str]:
         """Return the domains that are matched."""
@@ -129,11 +202,9 @@ class IntegrationMatcher:
         ):
             # We have seen all fields so we can skip the rest of the matchers
             return matched_domains
-        matched_domains = {
-            matcher[DOMAIN] for matcher in self._index.match(service_info)
-        }
-        if not matched_domains:
+        if not (index_domains := self._match_index_domains(service_info)):
             return matched_domains
+        matched_domains = set(index_domains)
         if previous_match:
             previous_match.manufacturer_data |= bool(
                 advertisement_data.manufacturer_data
@@ -57,7 +57,13 @@ from .trace import ConversationTraceEventType, async_conversation_trace_append
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
-_ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
+_ENTITY_REGISTRY_UPDATE_FIELDS = [
+    "aliases",
+    "entity_category",
+    "hidden_by",
+    "name",
+    "original_name",
+]
 
 REGEX_TYPE = type(re.compile(""))
 TRIGGER_CALLBACK_TYPE = Callable[
@@ -160,6 +166,8 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        # Names of all entities, including unexposed ones
+        self._all_entity_names: TextSlotList | None = None
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
@@ -229,6 +237,7 @@ class DefaultAgent(ConversationEntity):
             return None
 
         slot_lists = self._make_slot_lists()
+        assert self._all_entity_names is not None
         intent_context = self._make_intent_context(user_input)
 
         start = time.monotonic()
@@ -240,11 +249,14 @@ class DefaultAgent(ConversationEntity):
             slot_lists,
             intent_context,
             language,
+            self._all_entity_names,
         )
 
-        _LOGGER.debug(
-            "Recognize done in %.2f seconds",
-            time.monotonic() - start,
+        recognize_time = time.monotonic() - start
+        _LOGGER.debug("Recognize done in %.2f seconds", recognize_time)
+        async_conversation_trace_append(
+            ConversationTraceEventType.AGENT_DETAIL,
+            {"recognize_time": round(recognize_time, 4)},
         )
 
         return result
@@ -436,6 +448,7 @@ class DefaultAgent(ConversationEntity):
         slot_lists: dict[str, SlotList],
         intent_context: dict[str, Any] | None,
         language: str,
+        all_entity_names: TextSlotList,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
         strict_result = self._recognize_strict(
@@ -447,40 +460,7 @@ class DefaultAgent(ConversationEntity):
             return strict_result
 
         # Try again with all entities (including unexposed)
-        entity_registry = er.async_get(self.hass)
-        all_entity_names: list[tuple[str, str, dict[str, Any]]] = []
-
-        for state in self.hass.states.async_all():
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            if entity := entity_registry.async_get(state.entity_id):
-                # Skip config/hidden entities
-                if (entity.entity_category is not None) or (
-                    entity.hidden_by is not None
-                ):
-                    continue
-
-                if entity.aliases:
-                    # Also add aliases
-                    for alias in entity.aliases:
-                        if not alias.strip():
-                            continue
-
-                        all_entity_names.append((alias, alias, context))
-
-            # Default name
-            all_entity_names.append((state.name, state.name, context))
-
-        slot_lists = {
-            **slot_lists,
-            "name": TextSlotList.from_tuples(all_entity_names, allow_template=False),
-        }
+        slot_lists = {**slot_lists, "name": all_entity_names}
 
         strict_result = self._recognize_strict(
             user_input,
@@ -901,6 +881,7 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_clear_slot_list is None:
             return
         self._slot_lists = None
+        self._all_entity_names = None
         for unsub in self._unsub_clear_slot_list:
             unsub()
         self._unsub_clear_slot_list = None
@@ -923,6 +904,7 @@ class DefaultAgent(ConversationEntity):
         # values for a list, just the first. So we will need to match by name no
         # matter what.
         exposed_entity_names = []
+        all_entity_names = []
         for state in self.hass.states.async_all():
             is_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
 
@@ -935,9 +917,12 @@ class DefaultAgent(ConversationEntity):
                         continue
                     context[attr] = state.attributes[attr]
 
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
+            entity = entity_registry.async_get(state.entity_id)
+            # Config/hidden entities are skipped when matching all entities
+            is_skipped = entity is not None and (
+                (entity.entity_category is not None) or (entity.hidden_by is not None)
+            )
+            if entity and entity.aliases:
                 for alias in entity.aliases:
                     if not alias.strip():
                         continue
@@ -945,11 +930,15 @@ class DefaultAgent(ConversationEntity):
                     name_tuple = (alias, alias, context)
                     if is_exposed:
                         exposed_entity_names.append(name_tuple)
+                    if not is_skipped:
+                        all_entity_names.append(name_tuple)
 
             # Default name
             name_tuple = (state.name, state.name, context)
             if is_exposed:
                 exposed_entity_names.append(name_tuple)
+            if not is_skipped:
+                all_entity_names.append(name_tuple)
 
         _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
 
@@ -990,6 +979,9 @@ class DefaultAgent(ConversationEntity):
             ),
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
+        self._all_entity_names = TextSlotList.from_tuples(
+            all_entity_names, allow_template=False
+        )
 
         self._listen_clear_slot_list()
 
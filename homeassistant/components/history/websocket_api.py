@@ -455,7 +455,7 @@ async def ws_stream(
             _async_send_empty_response(connection, msg_id, start_time, end_time)
             return
 
-        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.subscriptions[msg_id] = websocket_api.async_cancel_handler_callback()
         connection.send_result(msg_id)
         await _async_send_historical_states(
             hass,
@@ -518,7 +518,15 @@ async def ws_stream(
         minimal_response=minimal_response,
     )
     subscriptions_setup_complete_time = dt_util.utcnow()
-    connection.subscriptions[msg_id] = _unsub
+    cancel_handler = websocket_api.async_cancel_handler_callback()
+
+    @callback
+    def _unsub_and_cancel() -> None:
+        """Unsubscribe and stop fetching from the database."""
+        _unsub()
+        cancel_handler()
+
+    connection.subscriptions[msg_id] = _unsub_and_cancel
     connection.send_result(msg_id)
     # Fetch everything from history
     last_event_time = await _async_send_historical_states(
@@ -7,7 +7,14 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -17,6 +24,10 @@ from homeassistant.helpers.typing import ConfigType
 CONF_EVENT_TYPE = "event_type"
 CONF_EVENT_CONTEXT = "context"
 
+# Event data keys that are used to route events to the trigger
+# with a dict lookup instead of filtering every event
+KEYED_EVENT_DATA = (ATTR_DEVICE_ID, ATTR_ENTITY_ID)
+
 
 def _validate_event_types(value: Any) -> Any:
     """Validate the event types.
@@ -69,6 +80,7 @@ async def async_attach_trigger(
         )
     event_data_schema: vol.Schema | None = None
     event_data_items: ItemsView | None = None
+    event_data_key: tuple[str, str] | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         event_data = {}
@@ -87,6 +99,14 @@ async def async_attach_trigger(
         else:
             # Use a simple items comparison if possible
             event_data_items = event_data.items()
+            event_data_key = next(
+                (
+                    (data_key, value)
+                    for data_key in KEYED_EVENT_DATA
+                    if isinstance(value := event_data.get(data_key), str)
+                ),
+                None,
+            )
 
     event_context_schema: vol.Schema | None = None
     event_context_items: ItemsView | None = None
@@ -165,11 +185,25 @@ async def async_attach_trigger(
             event.context,
         )
 
-    event_filter = filter_event if event_data_items or event_data_schema else None
-    removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
-        for event_type in event_types
-    ]
+    if event_data_key and MATCH_ALL not in event_types:
+        data_key, key = event_data_key
+
+        @callback
+        def handle_keyed_event(event: Event) -> None:
+            """Handle events routed by key when all the data matches."""
+            if filter_event(event.data):
+                handle_event(event)
+
+        removes = [
+            hass.bus.async_listen_keyed(event_type, {data_key: key}, handle_keyed_event)
+            for event_type in event_types
+        ]
+    else:
+        event_filter = filter_event if event_data_items or event_data_schema else None
+        removes = [
+            hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+            for event_type in event_types
+        ]
 
     @callback
     def remove_listen_events() -> None:
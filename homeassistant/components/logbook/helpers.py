@@ -108,52 +108,32 @@ def extract_attr(source: Mapping[str, Any], attr: str) -> list[str]:
 def event_forwarder_filtered(
     target: Callable[[Event], None],
     entities_filter: Callable[[str], bool] | None,
-    entity_ids: list[str] | None,
-    device_ids: list[str] | None,
 ) -> Callable[[Event], None]:
     """Make a callable to filter events."""
-    if not entities_filter and not entity_ids and not device_ids:
+    if not entities_filter:
         # No filter
         # - Script Trace (context ids)
         # - Automation Trace (context ids)
         return target
 
-    if entities_filter:
-        # We have an entity filter:
-        # - Logbook panel
-
-        @callback
-        def _forward_events_filtered_by_entities_filter(event: Event) -> None:
-            assert entities_filter is not None
-            event_data = event.data
-            entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
-            if entity_ids and not any(
-                entities_filter(entity_id) for entity_id in entity_ids
-            ):
-                return
-            domain = event_data.get(ATTR_DOMAIN)
-            if domain and not entities_filter(f"{domain}._"):
-                return
-            target(event)
-
-        return _forward_events_filtered_by_entities_filter
-
-    # We are filtering on entity_ids and/or device_ids:
-    # - Areas
-    # - Devices
-    # - Logbook Card
-    entity_ids_set = set(entity_ids) if entity_ids else set()
-    device_ids_set = set(device_ids) if device_ids else set()
+    # We have an entity filter:
+    # - Logbook panel
 
     @callback
-    def _forward_events_filtered_by_device_entity_ids(event: Event) -> None:
+    def _forward_events_filtered_by_entities_filter(event: Event) -> None:
+        assert entities_filter is not None
         event_data = event.data
-        if entity_ids_set.intersection(
-            extract_attr(event_data, ATTR_ENTITY_ID)
-        ) or device_ids_set.intersection(extract_attr(event_data, ATTR_DEVICE_ID)):
-            target(event)
+        entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
+        if entity_ids and not any(
+            entities_filter(entity_id) for entity_id in entity_ids
+        ):
+            return
+        domain = event_data.get(ATTR_DOMAIN)
+        if domain and not entities_filter(f"{domain}._"):
+            return
+        target(event)
 
-    return _forward_events_filtered_by_device_entity_ids
+    return _forward_events_filtered_by_entities_filter
 
 
 @callback
@@ -172,12 +152,31 @@ def async_subscribe_events(
     the live logbook stream.
     """
     assert is_callback(target), "target must be a callback"
-    event_forwarder = event_forwarder_filtered(
-        target, entities_filter, entity_ids, device_ids
-    )
-    subscriptions.extend(
-        hass.bus.async_listen(event_type, event_forwarder) for event_type in event_types
-    )
+    if not entities_filter and (entity_ids or device_ids):
+        # We are filtering on entity_ids and/or device_ids:
+        # - Areas
+        # - Devices
+        # - Logbook Card
+        # Route the events by entity_id and device_id instead of
+        # filtering every event
+        keys = {
+            data_key: ids
+            for data_key, ids in (
+                (ATTR_ENTITY_ID, entity_ids),
+                (ATTR_DEVICE_ID, device_ids),
+            )
+            if ids
+        }
+        subscriptions.extend(
+            hass.bus.async_listen_keyed(event_type, keys, target)
+            for event_type in event_types
+        )
+    else:
+        event_forwarder = event_forwarder_filtered(target, entities_filter)
+        subscriptions.extend(
+            hass.bus.async_listen(event_type, event_forwarder)
+            for event_type in event_types
+        )
 
     if device_ids and not entity_ids:
         # No entities to subscribe to but we are filtering
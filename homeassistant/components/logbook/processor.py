@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import chain, islice
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -84,6 +85,17 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of logbook entries humanified at a time when streaming
+LOGBOOK_CHUNK_SIZE = 1000
+
+# The number of contexts remembered to augment later rows with. Context
+# rows are almost always close to the rows they caused so only the most
+# recent ones are kept to bound memory for long periods.
+CONTEXT_LOOKUP_WINDOW = 16384
+
+# The number of events the EventCache holds before it starts over
+EVENT_CACHE_WINDOW = 4096
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -156,6 +168,19 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(chain.from_iterable(self.get_events_chunked(start_day, end_day)))
+
+    def get_events_chunked(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[list[dict[str, Any]]]:
+        """Get events for a period of time in chunks of LOGBOOK_CHUNK_SIZE.
+
+        The rows are humanified while they are read from the database
+        so the first chunk is available before the whole period has
+        been fetched.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -180,9 +205,21 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            events = _humanify(
+                self.hass,
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
+            while chunk := list(islice(events, LOGBOOK_CHUNK_SIZE)):
+                yield chunk
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -225,6 +262,9 @@ def _humanify(
         context_id_bin = row[CONTEXT_ID_BIN_POS]
         if memoize_new_contexts and context_id_bin not in context_lookup:
             context_lookup[context_id_bin] = row
+            if len(context_lookup) > CONTEXT_LOOKUP_WINDOW:
+                # Forget the oldest context
+                del context_lookup[next(iter(context_lookup))]
         if row[CONTEXT_ONLY_POS]:
             continue
         event_type = row[EVENT_TYPE_POS]
@@ -430,6 +470,8 @@ class EventCache:
             return LazyEventPartialState(row, self._event_data_cache)
         if event := self.event_cache.get(row):
             return event
+        if len(self.event_cache) >= EVENT_CACHE_WINDOW:
+            self.clear()
         self.event_cache[row] = lazy_event = LazyEventPartialState(
             row, self._event_data_cache
         )
@@ -104,6 +104,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -125,6 +126,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -136,6 +138,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -156,13 +159,28 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
+    """Async wrapper around _ws_stream_get_events."""
+
+    @callback
+    def _async_send_chunk(message: bytes) -> None:
+        """Send a chunk unless the client unsubscribed in the meantime."""
+        if msg_id in connection.subscriptions:
+            connection.send_message(message)
+
+    def _send_chunk(message: bytes) -> bool:
+        """Send a chunk from the executor."""
+        if msg_id not in connection.subscriptions:
+            return False
+        hass.loop.call_soon_threadsafe(_async_send_chunk, message)
+        return True
+
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
         msg_id,
@@ -170,6 +188,7 @@ async def _async_get_ws_stream_events(
         end_time,
         event_processor,
         partial,
+        _send_chunk,
     )
 
 
@@ -190,20 +209,57 @@ def _ws_stream_get_events(
     end_day: dt,
     event_processor: EventProcessor,
     partial: bool,
+    send_chunk: Callable[[bytes], bool],
 ) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    All but the last chunk of events are passed to send_chunk as soon
+    as they are ready so the client can show the first events while
+    the rest of the period is still being read. Each chunk covers the
+    time from the end of the previous chunk to its last event, and the
+    last chunk ends at end_day. Fetching stops when send_chunk returns
+    False.
+    """
+    events: list[dict[str, Any]] = []
+    chunk_start = start_day.timestamp()
+    for chunk in event_processor.get_events_chunked(start_day, end_day):
+        if events:
+            chunk_end: float = events[-1]["when"]
+            if not send_chunk(
+                _ws_stream_message(msg_id, events, chunk_start, chunk_end, True)
+            ):
+                break
+            chunk_start = chunk_end
+        events = chunk
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
-    message = _generate_stream_message(events, start_day, end_day)
+    return (
+        _ws_stream_message(msg_id, events, chunk_start, end_day.timestamp(), partial),
+        last_time,
+    )
+
+
+def _ws_stream_message(
+    msg_id: int,
+    events: list[dict[str, Any]],
+    start_time: float,
+    end_time: float,
+    partial: bool,
+) -> bytes:
+    """Generate a JSON logbook stream event message."""
+    message: dict[str, Any] = {
+        "events": events,
+        "start_time": start_time,
+        "end_time": end_time,
+    }
     if partial:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return json_bytes(messages.event_message(msg_id, message)), last_time
+    return json_bytes(messages.event_message(msg_id, message))
 
 
 async def _async_events_consumer(
@@ -301,7 +357,7 @@ async def ws_event_stream(
 
     if end_time and end_time <= utc_now:
         # Not live stream but we it might be a big query
-        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.subscriptions[msg_id] = websocket_api.async_cancel_handler_callback()
         connection.send_result(msg_id)
         # Fetch everything from history
         await _async_send_historical_events(
@@ -367,7 +423,15 @@ async def ws_event_stream(
         device_ids,
     )
     subscriptions_setup_complete_time = dt_util.utcnow()
-    connection.subscriptions[msg_id] = _unsub
+    cancel_handler = websocket_api.async_cancel_handler_callback()
+
+    @callback
+    def _unsub_and_cancel() -> None:
+        """Unsubscribe and stop fetching from the database."""
+        _unsub()
+        cancel_handler()
+
+    connection.subscriptions[msg_id] = _unsub_and_cancel
     connection.send_result(msg_id)
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
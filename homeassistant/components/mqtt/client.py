@@ -267,12 +267,23 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A topic level in the trie of wildcard subscriptions."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # The subscriptions with a topic filter ending at this level
+        self.subscriptions: set[Subscription] = set()
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -377,6 +388,9 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        # The wildcard subscriptions are also kept in a trie by topic level
+        # so matching a topic does not depend on the number of subscriptions
+        self._wildcard_subscriptions_trie = _SubscriptionTrieNode()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -755,6 +769,12 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            node = self._wildcard_subscriptions_trie
+            for level in subscription.topic.split("/"):
+                if (child := node.children.get(level)) is None:
+                    child = node.children[level] = _SubscriptionTrieNode()
+                node = child
+            node.subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,9 +793,26 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._async_untrack_wildcard_subscription(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
+    @callback
+    def _async_untrack_wildcard_subscription(self, subscription: Subscription) -> None:
+        """Remove a wildcard subscription from the trie."""
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._wildcard_subscriptions_trie
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the levels which are no longer used by any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
     @callback
     def _async_queue_subscriptions(
         self, subscriptions: Iterable[tuple[str, int]], queue_only: bool = False
@@ -835,9 +872,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1049,13 +1085,28 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if not self._wildcard_subscriptions:
+            return subscriptions
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        normal = not topic.startswith("$")
+        nodes = [(self._wildcard_subscriptions_trie, 0)]
+        while nodes:
+            node, idx = nodes.pop()
+            children = node.children
+            wildcards_match = normal or idx > 0
+            # A multi-level wildcard also matches the parent level
+            if wildcards_match and (child := children.get("#")):
+                subscriptions.extend(child.subscriptions)
+            if idx == depth:
+                subscriptions.extend(node.subscriptions)
+                continue
+            level = levels[idx]
+            if level not in ("+", "#") and (child := children.get(level)):
+                nodes.append((child, idx + 1))
+            if wildcards_match and (child := children.get("+")):
+                nodes.append((child, idx + 1))
         return subscriptions
 
     @callback
@@ -1247,13 +1298,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
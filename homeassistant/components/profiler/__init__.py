@@ -23,7 +23,10 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_scheduled_timers_by_integration,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
@@ -259,6 +262,10 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+        _LOGGER.critical(
+            "Scheduled timers per integration: %s",
+            async_get_scheduled_timers_by_integration(hass),
+        )
 
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
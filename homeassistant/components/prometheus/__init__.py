@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.exposition import choose_encoder
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
 
@@ -70,7 +72,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -95,6 +103,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -110,6 +119,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_REQUIRES_AUTH, default=True): cv.boolean,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -128,8 +138,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -151,11 +159,22 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
-    hass.bus.listen(
-        EVENT_ENTITY_REGISTRY_UPDATED,
-        metrics.handle_entity_registry_updated,
-    )
+    if conf[CONF_COLLECT_ON_SCRAPE]:
+        # Only remember the latest state of each entity and
+        # update the metrics when they are scraped
+        hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.async_queue_state_changed_event)
+        hass.bus.listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            metrics.async_queue_entity_registry_updated,
+        )
+    else:
+        hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH]))
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+        hass.bus.listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            metrics.handle_entity_registry_updated,
+        )
 
     for state in hass.states.all():
         if entity_filter(state.entity_id):
@@ -198,6 +217,11 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        # Changes queued until the next scrape when collecting on scrape.
+        # Each state is stored with the state before the first queued
+        # change and the number of changes.
+        self._pending_states: dict[str, tuple[State | None, State, int]] = {}
+        self._pending_removals: list[str] = []
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
@@ -208,14 +232,69 @@ class PrometheusMetrics:
             _LOGGER.debug("Filtered out entity %s", state.entity_id)
             return
 
-        if (old_state := event.data.get("old_state")) is not None and (
+        self._handle_state_change(event.data.get("old_state"), state, 1)
+
+    @callback
+    def async_queue_state_changed_event(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue a state change to be handled on the next scrape."""
+        if (state := event.data["new_state"]) is None:
+            return
+
+        entity_id = state.entity_id
+        if not self._filter(entity_id):
+            return
+
+        pending_states = self._pending_states
+        if (pending := pending_states.get(entity_id)) is None:
+            pending_states[entity_id] = (event.data["old_state"], state, 1)
+        else:
+            pending_states[entity_id] = (pending[0], state, pending[2] + 1)
+
+    @callback
+    def async_queue_entity_registry_updated(
+        self, event: Event[EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Queue removing the labelsets of an entity until the next scrape."""
+        if metrics_entity_id := self._removed_metrics_entity_id(event):
+            self._pending_states.pop(metrics_entity_id, None)
+            self._pending_removals.append(metrics_entity_id)
+
+    @callback
+    def async_pop_pending(
+        self,
+    ) -> tuple[list[str], list[tuple[State | None, State, int]]]:
+        """Return and clear the changes queued since the last scrape."""
+        pending_removals = self._pending_removals
+        pending_states = self._pending_states
+        self._pending_removals = []
+        self._pending_states = {}
+        return pending_removals, list(pending_states.values())
+
+    def handle_pending(
+        self,
+        pending_removals: list[str],
+        pending_states: list[tuple[State | None, State, int]],
+    ) -> None:
+        """Update the metrics with the changes queued since the last scrape."""
+        for entity_id in pending_removals:
+            self._remove_labelsets(entity_id)
+        for old_state, state, changes in pending_states:
+            self._handle_state_change(old_state, state, changes)
+
+    def _handle_state_change(
+        self, old_state: State | None, state: State, changes: int
+    ) -> None:
+        """Handle a state change that passed the filter."""
+        if old_state is not None and (
             old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
         ) != state.attributes.get(ATTR_FRIENDLY_NAME):
             self._remove_labelsets(old_state.entity_id, old_friendly_name)
 
-        self.handle_state(state)
+        self.handle_state(state, changes)
 
-    def handle_state(self, state: State) -> None:
+    def handle_state(self, state: State, changes: int = 1) -> None:
         """Add/update a state in Prometheus."""
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
@@ -225,14 +304,16 @@ class PrometheusMetrics:
 
         handler = f"_handle_{domain}"
 
+        # Handlers get the number of changes coalesced into this state
+        # so counters stay exact when collecting on scrape
         if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+            getattr(self, handler)(state, changes)
 
         labels = self._labels(state)
         state_change = self._metric(
             "state_change", prometheus_client.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**labels).inc(changes)
 
         entity_available = self._metric(
             "entity_available",
@@ -252,8 +333,16 @@ class PrometheusMetrics:
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
         """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry."""
+        if metrics_entity_id := self._removed_metrics_entity_id(event):
+            self._remove_labelsets(metrics_entity_id)
+
+    @staticmethod
+    def _removed_metrics_entity_id(
+        event: Event[EventEntityRegistryUpdatedData],
+    ) -> str | None:
+        """Return the entity id whose labelsets must be removed."""
         if event.data["action"] in (None, "create"):
-            return
+            return None
 
         entity_id = event.data.get("entity_id")
         _LOGGER.debug("Handling entity update for %s", entity_id)
@@ -270,8 +359,7 @@ class PrometheusMetrics:
             elif "disabled_by" in changes:
                 metrics_entity_id = entity_id
 
-        if metrics_entity_id:
-            self._remove_labelsets(metrics_entity_id)
+        return metrics_entity_id
 
     def _remove_labelsets(
         self, entity_id: str, friendly_name: str | None = None
@@ -376,7 +464,7 @@ class PrometheusMetrics:
             except ValueError:
                 pass
 
-    def _handle_binary_sensor(self, state: State) -> None:
+    def _handle_binary_sensor(self, state: State, changes: int) -> None:
         metric = self._metric(
             "binary_sensor_state",
             prometheus_client.Gauge,
@@ -385,7 +473,7 @@ class PrometheusMetrics:
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
-    def _handle_input_boolean(self, state: State) -> None:
+    def _handle_input_boolean(self, state: State, changes: int) -> None:
         metric = self._metric(
             "input_boolean_state",
             prometheus_client.Gauge,
@@ -419,13 +507,13 @@ class PrometheusMetrics:
                 )
             metric.labels(**self._labels(state)).set(value)
 
-    def _handle_input_number(self, state: State) -> None:
+    def _handle_input_number(self, state: State, changes: int) -> None:
         self._numeric_handler(state, "input_number", "input number")
 
-    def _handle_number(self, state: State) -> None:
+    def _handle_number(self, state: State, changes: int) -> None:
         self._numeric_handler(state, "number", "number")
 
-    def _handle_device_tracker(self, state: State) -> None:
+    def _handle_device_tracker(self, state: State, changes: int) -> None:
         metric = self._metric(
             "device_tracker_state",
             prometheus_client.Gauge,
@@ -434,14 +522,14 @@ class PrometheusMetrics:
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
-    def _handle_person(self, state: State) -> None:
+    def _handle_person(self, state: State, changes: int) -> None:
         metric = self._metric(
             "person_state", prometheus_client.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
-    def _handle_cover(self, state: State) -> None:
+    def _handle_cover(self, state: State, changes: int) -> None:
         metric = self._metric(
             "cover_state",
             prometheus_client.Gauge,
@@ -473,7 +561,7 @@ class PrometheusMetrics:
             )
             tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
 
-    def _handle_light(self, state: State) -> None:
+    def _handle_light(self, state: State, changes: int) -> None:
         metric = self._metric(
             "light_brightness_percent",
             prometheus_client.Gauge,
@@ -491,7 +579,7 @@ class PrometheusMetrics:
         except ValueError:
             pass
 
-    def _handle_lock(self, state: State) -> None:
+    def _handle_lock(self, state: State, changes: int) -> None:
         metric = self._metric(
             "lock_state", prometheus_client.Gauge, "State of the lock (0/1)"
         )
@@ -513,7 +601,7 @@ class PrometheusMetrics:
             )
             metric.labels(**self._labels(state)).set(temp)
 
-    def _handle_climate(self, state: State) -> None:
+    def _handle_climate(self, state: State, changes: int) -> None:
         self._handle_climate_temp(
             state,
             ATTR_TEMPERATURE,
@@ -593,7 +681,7 @@ class PrometheusMetrics:
                     float(mode == fan_mode)
                 )
 
-    def _handle_humidifier(self, state: State) -> None:
+    def _handle_humidifier(self, state: State, changes: int) -> None:
         humidifier_target_humidity_percent = state.attributes.get(ATTR_HUMIDITY)
         if humidifier_target_humidity_percent:
             metric = self._metric(
@@ -628,7 +716,7 @@ class PrometheusMetrics:
                     float(mode == current_mode)
                 )
 
-    def _handle_sensor(self, state: State) -> None:
+    def _handle_sensor(self, state: State, changes: int) -> None:
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
 
         for metric_handler in self._sensor_metric_handlers:
@@ -717,7 +805,7 @@ class PrometheusMetrics:
         default = default.lower()
         return units.get(unit, default)
 
-    def _handle_switch(self, state: State) -> None:
+    def _handle_switch(self, state: State, changes: int) -> None:
         metric = self._metric(
             "switch_state", prometheus_client.Gauge, "State of the switch (0/1)"
         )
@@ -730,7 +818,7 @@ class PrometheusMetrics:
 
         self._handle_attributes(state)
 
-    def _handle_fan(self, state: State) -> None:
+    def _handle_fan(self, state: State, changes: int) -> None:
         metric = self._metric(
             "fan_state", prometheus_client.Gauge, "State of the fan (0/1)"
         )
@@ -787,19 +875,19 @@ class PrometheusMetrics:
             elif fan_direction == DIRECTION_REVERSE:
                 fan_direction_metric.labels(**self._labels(state)).set(1)
 
-    def _handle_zwave(self, state: State) -> None:
+    def _handle_zwave(self, state: State, changes: int) -> None:
         self._battery(state)
 
-    def _handle_automation(self, state: State) -> None:
+    def _handle_automation(self, state: State, changes: int) -> None:
         metric = self._metric(
             "automation_triggered_count",
             prometheus_client.Counter,
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        metric.labels(**self._labels(state)).inc(changes)
 
-    def _handle_counter(self, state: State) -> None:
+    def _handle_counter(self, state: State, changes: int) -> None:
         metric = self._metric(
             "counter_value",
             prometheus_client.Gauge,
@@ -808,7 +896,7 @@ class PrometheusMetrics:
 
         metric.labels(**self._labels(state)).set(self.state_as_number(state))
 
-    def _handle_update(self, state: State) -> None:
+    def _handle_update(self, state: State, changes: int) -> None:
         metric = self._metric(
             "update_state",
             prometheus_client.Gauge,
@@ -817,7 +905,7 @@ class PrometheusMetrics:
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
-    def _handle_alarm_control_panel(self, state: State) -> None:
+    def _handle_alarm_control_panel(self, state: State, changes: int) -> None:
         current_state = state.state
 
         if current_state:
@@ -853,19 +941,46 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(
+        self, requires_auth: bool, pending_metrics: PrometheusMetrics | None = None
+    ) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._pending_metrics = pending_metrics
+        # Scrapes must handle the queued changes in order
+        self._pending_lock = asyncio.Lock()
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        if encoder is prometheus_client.generate_latest:
+            content_type = CONTENT_TYPE_TEXT_PLAIN
+        if (pending_metrics := self._pending_metrics) is None:
+            body = await hass.async_add_executor_job(
+                encoder, prometheus_client.REGISTRY
+            )
+        else:
+            async with self._pending_lock:
+                body = await hass.async_add_executor_job(
+                    self._handle_pending_and_encode,
+                    pending_metrics,
+                    *pending_metrics.async_pop_pending(),
+                    encoder,
+                )
+        response = web.Response(body=body, headers={hdrs.CONTENT_TYPE: content_type})
+        response.enable_compression()
+        return response
+
+    @staticmethod
+    def _handle_pending_and_encode(
+        pending_metrics: PrometheusMetrics,
+        pending_removals: list[str],
+        pending_states: list[tuple[State | None, State, int]],
+        encoder: Callable[[prometheus_client.CollectorRegistry], bytes],
+    ) -> bytes:
+        """Update the metrics with the queued changes and encode them."""
+        pending_metrics.handle_pending(pending_removals, pending_states)
+        return encoder(prometheus_client.REGISTRY)
@@ -77,7 +77,8 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBExecutorStats, DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -173,6 +174,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_max_states: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -212,6 +214,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -220,6 +223,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.history_cache = HistoryCache(history_cache_max_states)
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -229,6 +233,7 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.db_executor_stats = DBExecutorStats()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -290,6 +295,7 @@ class Recorder(threading.Thread):
             thread_name_prefix=DB_WORKER_PREFIX,
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
+            stats=self.db_executor_stats,
         )
 
     def _shutdown_pool(self) -> None:
@@ -1136,31 +1142,16 @@ class Recorder(threading.Thread):
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
-        shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
-        # Matching attributes found in the pending commit
-        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
-        # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
-            and (
-                attributes_id := state_attributes_manager.get(
-                    shared_attrs, hash_, session
-                )
-            )
-        ):
-            dbstate.attributes_id = attributes_id
+        state_attributes_manager.link_state(
+            dbstate, shared_attrs_bytes.decode("utf-8"), shared_attrs_bytes
+        )
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_write(entity_id, dbstate)
         else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
-
-        self._add_to_session(session, dbstate)
+            self._add_to_session(session, dbstate)
+        self.history_cache.add_pending(dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1208,6 +1199,25 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        state_attributes_manager = self.state_attributes_manager
+        if state_attributes_manager.has_unresolved:
+            for (
+                shared_attrs,
+                data_hash,
+                dbstates,
+            ) in state_attributes_manager.resolve_unresolved(session):
+                # No matching attributes found, save them in the DB
+                dbstate_attributes = StateAttributes(
+                    shared_attrs=shared_attrs, hash=data_hash
+                )
+                state_attributes_manager.add_pending(dbstate_attributes)
+                self._add_to_session(session, dbstate_attributes)
+                for dbstate in dbstates:
+                    dbstate.state_attributes = dbstate_attributes
+
+        if self.states_manager.has_pending_writes:
+            self.states_manager.write_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1235,6 +1245,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self.history_cache.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1263,6 +1274,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.history_cache.reset()
+        statistics.get_statistics_rollup_cache(self.hass).clear()
 
         if not self.event_session:
             return
@@ -1425,6 +1438,10 @@ class Recorder(threading.Thread):
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
+        # States can only be written with multi-row inserts if the
+        # database can return the generated primary keys, otherwise
+        # they are added to the session one by one.
+        self._bulk_insert_states = self.engine.dialect.insert_executemany_returning
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1441,6 +1458,7 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
 
+        self.history_cache.start(self.recorder_runs_manager.recording_start.timestamp())
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self) -> None:
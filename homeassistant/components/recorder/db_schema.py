@@ -616,10 +616,16 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
-        encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        if dialect != PSQL_DIALECT and exclude_attrs.isdisjoint(state.attributes):
+            # Nothing to exclude so the attributes JSON of the state
+            # can be used as is, it is shared with the previous state
+            # of the entity when the attributes did not change.
+            bytes_result = state.attributes_json
+        else:
+            encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
+            bytes_result = encoder(
+                {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+            )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
@@ -2,14 +2,70 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Callable
+from concurrent.futures import Future
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
+import time
 from typing import Any
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+# Upper bounds in seconds of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.01, 0.1, 1.0, 10.0)
+
+
+class DBExecutorStats:
+    """Track the queue depth and latencies of the database executor."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.cancelled = 0
+        self.wait_time = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.run_time = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def job_queued(self) -> None:
+        """Record a job was submitted to the executor."""
+        with self._lock:
+            self.queue_depth += 1
+
+    def job_cancelled(self) -> None:
+        """Record a job was cancelled before a worker picked it up."""
+        with self._lock:
+            self.queue_depth -= 1
+            self.cancelled += 1
+
+    def job_done(self, future: Future[Any]) -> None:
+        """Record a job was cancelled if it never ran."""
+        if future.cancelled():
+            self.job_cancelled()
+
+    def job_started(self, wait_time: float) -> None:
+        """Record a job was picked up by a worker after waiting wait_time."""
+        bucket = bisect_right(LATENCY_BUCKETS, wait_time)
+        with self._lock:
+            self.queue_depth -= 1
+            self.wait_time[bucket] += 1
+
+    def job_finished(self, run_time: float) -> None:
+        """Record a job finished after running for run_time."""
+        bucket = bisect_right(LATENCY_BUCKETS, run_time)
+        with self._lock:
+            self.run_time[bucket] += 1
+
+
+def format_latency_histogram(histogram: list[int]) -> str:
+    """Format a latency histogram of DBExecutorStats."""
+    labels = [f"<{bound:g}s" for bound in LATENCY_BUCKETS]
+    labels.append(f">={LATENCY_BUCKETS[-1]:g}s")
+    return ", ".join(
+        f"{label}: {count}" for label, count in zip(labels, histogram, strict=True)
+    )
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None],
@@ -31,9 +87,41 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
     ) -> None:
         """Init the executor with a shutdown hook support."""
         self._shutdown_hook: Callable[[], None] = kwargs.pop("shutdown_hook")
+        self._stats: DBExecutorStats = kwargs.pop("stats")
         self.recorder_and_worker_thread_ids = recorder_and_worker_thread_ids
         super().__init__(*args, **kwargs)
 
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Submit a job and track how long it waits and runs."""
+        stats = self._stats
+        stats.job_queued()
+        try:
+            future = super().submit(
+                self._run_tracked, time.monotonic(), fn, args, kwargs
+            )
+        except BaseException:
+            stats.job_cancelled()
+            raise
+        future.add_done_callback(stats.job_done)
+        return future
+
+    def _run_tracked(
+        self,
+        submitted: float,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run a job and record its latencies."""
+        started = time.monotonic()
+        self._stats.job_started(started - submitted)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._stats.job_finished(time.monotonic() - started)
+
     def _adjust_thread_count(self) -> None:
         """Overridden to add support for shutdown hook.
 
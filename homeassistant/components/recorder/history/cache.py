@@ -0,0 +1,286 @@
+"""Columnar in-memory cache of recently recorded states."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+import sys
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import State
+
+from ..db_schema import States
+
+# How far back the cache keeps the states of each entity
+HISTORY_CACHE_WINDOW = 86400
+
+# How often rows that fell out of the window are trimmed
+HISTORY_CACHE_TRIM_INTERVAL = 300
+
+
+class _EntityStates:
+    """Columns of the states recorded for a single metadata_id."""
+
+    __slots__ = ("states", "timestamps")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.timestamps: array[float] = array("d")
+        self.states: list[str | None] = []
+
+    def append(self, last_updated_ts: float, state: str | None) -> None:
+        """Append a state keeping the columns sorted by last_updated_ts."""
+        timestamps = self.timestamps
+        if not timestamps or last_updated_ts >= timestamps[-1]:
+            timestamps.append(last_updated_ts)
+            self.states.append(state)
+            return
+        idx = bisect_left(timestamps, last_updated_ts)
+        timestamps.insert(idx, last_updated_ts)
+        self.states.insert(idx, state)
+
+    def trim(self, cutoff_ts: float, keep_last: bool) -> int:
+        """Drop the states before cutoff_ts and return how many were dropped.
+
+        If keep_last is set, the newest state before cutoff_ts is
+        kept since it is still the state of the entity at cutoff_ts.
+        """
+        idx = bisect_left(self.timestamps, cutoff_ts)
+        if keep_last and idx:
+            idx -= 1
+        if idx:
+            del self.timestamps[:idx]
+            del self.states[:idx]
+        return idx
+
+
+class HistoryCache:
+    """Cache the states recorded during the current run.
+
+    The recorder thread adds the states it wrote once they have been
+    committed so the cache never contains data that is not in the
+    database. The cache is read from the database executor threads
+    to answer minimal history queries without going to the database.
+
+    At most max_states states are cached. When there are more, the
+    entities with the most states are evicted and are not cached again
+    until caching starts over, their history comes from the database.
+    """
+
+    def __init__(self, max_states: int) -> None:
+        """Initialize the history cache."""
+        self._lock = threading.Lock()
+        self._entities: dict[int, _EntityStates] = {}
+        self._evicted: set[int] = set()
+        self._max_states = max_states
+        self._size = 0
+        self._pending: list[States] = []
+        self._coverage_start_ts: float | None = None
+        self._next_trim_ts = 0.0
+
+    def start(self, run_start_ts: float) -> None:
+        """Start caching the states recorded since run_start_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._max_states:
+            return
+        with self._lock:
+            self._clear()
+            self._coverage_start_ts = run_start_ts
+        self._pending.clear()
+        self._next_trim_ts = time.time() + HISTORY_CACHE_TRIM_INTERVAL
+
+    def add_pending(self, dbstate: States) -> None:
+        """Add a state that will be cached once it has been committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._coverage_start_ts is not None:
+            self._pending.append(dbstate)
+
+    def post_commit_pending(self) -> None:
+        """Move the committed states into the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        now = time.time()
+        intern = sys.intern
+        with self._lock:
+            coverage_start_ts = self._coverage_start_ts
+            assert coverage_start_ts is not None
+            entities = self._entities
+            evicted = self._evicted
+            for dbstate in self._pending:
+                if (metadata_id := dbstate.metadata_id) is None and (
+                    states_meta := dbstate.states_meta_rel
+                ):
+                    metadata_id = states_meta.metadata_id
+                if (
+                    metadata_id is None
+                    or (last_updated_ts := dbstate.last_updated_ts) is None
+                    or metadata_id in evicted
+                ):
+                    continue
+                if last_updated_ts < coverage_start_ts:
+                    # A state older than the coverage may be newer than
+                    # the state kept for the start of the window
+                    self._pop_entity(metadata_id)
+                    continue
+                if (entity_states := entities.get(metadata_id)) is None:
+                    entity_states = entities[metadata_id] = _EntityStates()
+                state = dbstate.state
+                entity_states.append(
+                    last_updated_ts, None if state is None else intern(state)
+                )
+                self._size += 1
+            if self._size > self._max_states:
+                self._evict_largest()
+            if now >= self._next_trim_ts:
+                self._next_trim_ts = now + HISTORY_CACHE_TRIM_INTERVAL
+                self._trim(now - HISTORY_CACHE_WINDOW, True)
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        Caching starts over from now since we cannot know which
+        of the cached states are still in the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            self._clear()
+            if self._coverage_start_ts is not None:
+                self._coverage_start_ts = time.time()
+        self._pending.clear()
+
+    def evict_purged(self, purge_before_ts: float) -> None:
+        """Evict the states that were purged from the database."""
+        with self._lock:
+            self._trim(purge_before_ts, False)
+
+    def evict_purged_metadata_ids(self, metadata_ids: Iterable[int]) -> None:
+        """Evict all states of metadata_ids that were purged from the database."""
+        with self._lock:
+            for metadata_id in metadata_ids:
+                self._pop_entity(metadata_id)
+
+    def _clear(self) -> None:
+        """Clear the cached states, the lock must be held."""
+        self._entities.clear()
+        self._evicted.clear()
+        self._size = 0
+
+    def _pop_entity(self, metadata_id: int) -> None:
+        """Remove the states of a metadata_id, the lock must be held."""
+        if (entity_states := self._entities.pop(metadata_id, None)) is not None:
+            self._size -= len(entity_states.timestamps)
+
+    def _evict_largest(self) -> None:
+        """Evict the entities with the most states, the lock must be held."""
+        entities = self._entities
+        while self._size > self._max_states and entities:
+            metadata_id = max(
+                entities, key=lambda metadata_id: len(entities[metadata_id].timestamps)
+            )
+            self._pop_entity(metadata_id)
+            self._evicted.add(metadata_id)
+
+    def _trim(self, cutoff_ts: float, keep_last: bool) -> None:
+        """Trim the states before cutoff_ts, the lock must be held."""
+        if (coverage_start_ts := self._coverage_start_ts) is None:
+            return
+        self._coverage_start_ts = max(coverage_start_ts, cutoff_ts)
+        entities = self._entities
+        for metadata_id, entity_states in list(entities.items()):
+            self._size -= entity_states.trim(cutoff_ts, keep_last)
+            if not entity_states.timestamps:
+                del entities[metadata_id]
+
+    def get_minimal_compressed_states(
+        self,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        entity_ids: list[str],
+        entity_id_to_metadata_id: dict[str, int | None],
+    ) -> dict[str, list[State | dict[str, Any]]] | None:
+        """Return the minimal compressed states during a period.
+
+        The result matches what get_significant_states_with_session returns
+        for significant_changes_only, minimal_response and no_attributes
+        including the start time state. Returns None if the cache cannot
+        answer the query and the database must be used instead.
+        """
+        columns: list[tuple[str, str | None, array[float], list[str | None]]] = []
+        with self._lock:
+            if (
+                coverage_start_ts := self._coverage_start_ts
+            ) is None or start_time_ts < coverage_start_ts:
+                return None
+            entities = self._entities
+            for entity_id in entity_ids:
+                if (metadata_id := entity_id_to_metadata_id.get(entity_id)) is None:
+                    continue
+                if (entity_states := entities.get(metadata_id)) is None:
+                    return None
+                timestamps = entity_states.timestamps
+                states = entity_states.states
+                # The state at the start time is the last state
+                # recorded before it, without it we cannot know
+                # what to return.
+                if not (start_idx := bisect_left(timestamps, start_time_ts)):
+                    return None
+                # States recorded exactly at the start time
+                # are not part of the period
+                period_idx = bisect_right(timestamps, start_time_ts, start_idx)
+                end_idx = (
+                    len(timestamps)
+                    if end_time_ts is None
+                    else bisect_left(timestamps, end_time_ts, period_idx)
+                )
+                columns.append(
+                    (
+                        entity_id,
+                        states[start_idx - 1],
+                        timestamps[period_idx:end_idx],
+                        states[period_idx:end_idx],
+                    )
+                )
+
+        # Set all entity IDs to empty lists in result set to maintain the order
+        result: dict[str, list[State | dict[str, Any]]] = {
+            entity_id: [] for entity_id in entity_ids
+        }
+        for entity_id, prev_state, timestamps, states in columns:
+            ent_results: list[State | dict[str, Any]] = [
+                {
+                    COMPRESSED_STATE_STATE: prev_state,
+                    COMPRESSED_STATE_LAST_UPDATED: start_time_ts,
+                }
+            ]
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            ent_results.extend(
+                [
+                    {
+                        COMPRESSED_STATE_STATE: (prev_state := state),
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                    for last_updated_ts, state in zip(timestamps, states, strict=True)
+                    if state != prev_state
+                ]
+            )
+            result[entity_id] = ent_results
+        # Filter out the empty lists like the database query does
+        return {key: val for key, val in result.items() if val}
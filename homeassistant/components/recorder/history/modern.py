@@ -253,6 +253,26 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    # History graphs only need the state changes which
+    # the history cache can answer without the database.
+    if (
+        compressed_state_format
+        and minimal_response
+        and no_attributes
+        and significant_changes_only
+        and include_start_time_state
+        and not any(
+            split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+            for entity_id in entity_ids
+        )
+        and (
+            cached_states := instance.history_cache.get_minimal_compressed_states(
+                start_time_ts, end_time_ts, entity_ids, entity_id_to_metadata_id
+            )
+        )
+        is not None
+    ):
+        return cached_states
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
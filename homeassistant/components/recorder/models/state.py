@@ -96,6 +96,13 @@ class LazyState(State):
             assert self._last_updated_ts is not None
         return dt_util.utc_from_timestamp(self._last_updated_ts)
 
+    @cached_property  # type: ignore[override]
+    def last_updated_timestamp(self) -> float:
+        """Last updated timestamp."""
+        if TYPE_CHECKING:
+            assert self._last_updated_ts is not None
+        return self._last_updated_ts
+
     def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
         """Return a dict representation of the LazyState.
 
@@ -53,6 +53,10 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# How long a purge run may keep selecting new batches before it
+# returns so the recorder can work through its queue
+DEFAULT_PURGE_TIME_BUDGET = 5
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,11 +66,15 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = DEFAULT_PURGE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Purges up to states_batch_size and events_batch_size batches,
+    but stops selecting new batches once time_budget seconds have
+    passed. Returns False if there is more to purge.
     """
+    deadline = time.monotonic() + time_budget
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -87,11 +95,12 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
+        instance.history_cache.evict_purged(purge_before.timestamp())
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -178,6 +187,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +211,8 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +227,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,6 +249,8 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -628,6 +643,7 @@ def _purge_old_entity_ids(instance: Recorder, session: Session) -> None:
     # Evict any entries in the event_type cache referring to a purged state
     instance.states_meta_manager.evict_purged(purge_entity_ids)
     instance.states_manager.evict_purged_entity_ids(purge_entity_ids)
+    instance.history_cache.evict_purged_metadata_ids(states_metadata_ids)
 
 
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
@@ -640,7 +656,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -676,7 +692,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -702,6 +718,7 @@ def _purge_filtered_states(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
+    instance.history_cache.evict_purged_metadata_ids(metadata_ids_to_purge)
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
@@ -774,7 +791,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -5,12 +5,13 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
@@ -156,6 +157,9 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_ROLLUP_CACHE = "recorder_statistics_rollup_cache"
+# The number of rollups the statistics rollup cache keeps
+STATISTICS_ROLLUP_CACHE_SIZE = 1024
 
 
 def mean(values: list[float]) -> float | None:
@@ -199,6 +203,97 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+type _RollupKey = tuple[
+    str,
+    str,
+    frozenset[str],
+    Callable[[float | None], float | None] | Callable[[float], float] | None,
+    tzinfo,
+]
+
+
+@dataclasses.dataclass(slots=True)
+class StatisticsRollup:
+    """Statistics of a statistic_id reduced to completed periods."""
+
+    # The periods from start_ts up to end_ts have been reduced,
+    # periods without any hourly statistics have no row
+    start_ts: float
+    end_ts: float
+    rows: list[StatisticsRow]
+
+
+class StatisticsRollupCache:
+    """Cache for hourly statistics reduced to days, weeks and months.
+
+    A period is only cached once the hourly statistics of the whole period
+    have been compiled. After that it only changes if statistics are imported,
+    adjusted or cleared, which evicts the statistic_id from the cache.
+
+    At most STATISTICS_ROLLUP_CACHE_SIZE rollups are kept, the least
+    recently used rollup is dropped when there are more.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._rollups: dict[_RollupKey, StatisticsRollup] = {}
+        # Incremented on every eviction to avoid caching rollups
+        # which were reduced from statistics read before the eviction
+        self._generation = 0
+        # The end of the last compiled hour, set by the compile task
+        self._compiled_end_ts: float | None = None
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the cache."""
+        return self._generation
+
+    @property
+    def compiled_end_ts(self) -> float | None:
+        """Return the end of the last compiled hour if it is known."""
+        return self._compiled_end_ts
+
+    def set_compiled_end_ts(self, compiled_end_ts: float) -> None:
+        """Set the end of the last compiled hour."""
+        with self._lock:
+            if self._compiled_end_ts is None or compiled_end_ts > self._compiled_end_ts:
+                self._compiled_end_ts = compiled_end_ts
+
+    def get(self, key: _RollupKey) -> StatisticsRollup | None:
+        """Return the rollup for the key and mark it as recently used."""
+        with self._lock:
+            if (rollup := self._rollups.pop(key, None)) is not None:
+                self._rollups[key] = rollup
+            return rollup
+
+    def set(self, key: _RollupKey, rollup: StatisticsRollup, generation: int) -> None:
+        """Cache the rollup unless the cache was evicted since generation."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._rollups.pop(key, None)
+            self._rollups[key] = rollup
+            if len(self._rollups) > STATISTICS_ROLLUP_CACHE_SIZE:
+                # Drop the least recently used rollup
+                del self._rollups[next(iter(self._rollups))]
+
+    def evict(self, statistic_ids: Iterable[str]) -> None:
+        """Evict the rollups of the statistic_ids."""
+        statistic_ids = set(statistic_ids)
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._rollups if key[0] in statistic_ids]:
+                del self._rollups[key]
+
+    def clear(self) -> None:
+        """Evict all rollups."""
+        with self._lock:
+            self._generation += 1
+            self._rollups.clear()
+            self._compiled_end_ts = None
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -270,6 +365,20 @@ def _get_statistic_to_display_unit_converter(
     return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
 
 
+def _get_display_unit_converter_for_statistic(
+    hass: HomeAssistant,
+    metadata: StatisticMetaData,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    state_unit = unit = metadata["unit_of_measurement"]
+    if state := hass.states.get(metadata["statistic_id"]):
+        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    return _get_statistic_to_display_unit_converter(
+        unit, state_unit, requested_units, allow_none=False
+    )
+
+
 def _get_display_to_statistic_unit_converter(
     display_unit: str | None,
     statistic_unit: str | None,
@@ -483,6 +592,10 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    # Statistics have been compiled up to start
+    get_statistics_rollup_cache(instance.hass).set_compiled_end_ts(
+        _compiled_hourly_statistics_end_ts(start - StatisticsShortTerm.duration)
+    )
     return True
 
 
@@ -509,6 +622,10 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    get_statistics_rollup_cache(instance.hass).set_compiled_end_ts(
+        _compiled_hourly_statistics_end_ts(start)
+    )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -747,6 +864,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_rollup_cache(instance.hass).evict(statistic_ids)
 
 
 def update_statistics_metadata(
@@ -772,6 +890,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_rollup_cache(instance.hass).evict((statistic_id,))
 
 
 async def async_list_statistic_ids(
@@ -1113,6 +1232,25 @@ def _reduce_statistics_per_month(
     )
 
 
+_PERIOD_REDUCERS: dict[
+    str,
+    tuple[
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+        timedelta,
+    ],
+] = {
+    "day": (reduce_day_ts_factory, timedelta(days=1)),
+    "week": (reduce_week_ts_factory, timedelta(days=7)),
+    "month": (reduce_month_ts_factory, timedelta(days=31)),
+}
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1698,6 +1836,148 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _compiled_hourly_statistics_end_ts(last_run: datetime) -> float:
+    """Return the timestamp until which hourly statistics have been compiled."""
+    # The hourly statistics are compiled with the last 5-minute statistics of the hour
+    end = process_timestamp(last_run) + StatisticsShortTerm.duration
+    return end.replace(minute=0, second=0, microsecond=0).timestamp()
+
+
+def _get_compiled_hourly_statistics_end_ts(
+    hass: HomeAssistant, session: Session
+) -> float:
+    """Return the timestamp until which hourly statistics have been compiled.
+
+    The database is only queried until the compile task has set it.
+    """
+    rollup_cache = get_statistics_rollup_cache(hass)
+    if (compiled_end_ts := rollup_cache.compiled_end_ts) is not None:
+        return compiled_end_ts
+    compiled_end_ts = 0
+    if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
+        compiled_end_ts = _compiled_hourly_statistics_end_ts(last_run)
+    rollup_cache.set_compiled_end_ts(compiled_end_ts)
+    return compiled_end_ts
+
+
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return hourly statistics reduced to days, weeks or months.
+
+    Completed periods are taken from the rollup cache, only the hourly statistics
+    after them are read from the database and reduced.
+    """
+    reduce_ts_factory, period_duration = _PERIOD_REDUCERS[period]
+    same_period, period_start_end = reduce_ts_factory()
+    rollup_cache = get_statistics_rollup_cache(hass)
+    generation = rollup_cache.generation
+    time_zone = dt_util.get_default_time_zone()
+    frozen_types = frozenset(types)
+    # Align start and end with the periods, the first and last periods are
+    # always reduced from all their hourly statistics like the rows in the
+    # rollup cache, and only completed periods end up in the rollup cache.
+    start_ts = period_start_end(start_time.timestamp())[0]
+    end_ts: float | None = None
+    if end_time is not None:
+        end_ts = end_time.timestamp()
+        end_period_start_ts, end_period_end_ts = period_start_end(end_ts)
+        if end_period_start_ts != end_ts:
+            end_ts = end_period_end_ts
+        end_time = dt_util.utc_from_timestamp(end_ts)
+    # Periods which ended before the last compiled hour will not change anymore
+    complete_end_ts = period_start_end(
+        _get_compiled_hourly_statistics_end_ts(hass, session)
+    )[0]
+    if end_ts is not None:
+        complete_end_ts = min(complete_end_ts, end_ts)
+
+    rollups: dict[str, tuple[_RollupKey, StatisticsRollup | None, float]] = {}
+    resume_ts_by_metadata_id: dict[int, float] = {}
+    for statistic_id, (metadata_id, metadata_by_id) in metadata.items():
+        key: _RollupKey = (
+            statistic_id,
+            period,
+            frozen_types,
+            _get_display_unit_converter_for_statistic(hass, metadata_by_id, units),
+            time_zone,
+        )
+        resume_ts = start_ts
+        if (
+            rollup := rollup_cache.get(key)
+        ) and rollup.start_ts <= start_ts <= rollup.end_ts:
+            resume_ts = rollup.end_ts
+        else:
+            rollup = None
+        rollups[statistic_id] = (key, rollup, resume_ts)
+        if end_ts is None or resume_ts < end_ts:
+            resume_ts_by_metadata_id[metadata_id] = resume_ts
+
+    hourly_stats: dict[str, list[StatisticsRow]] = {}
+    if resume_ts_by_metadata_id:
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(min(resume_ts_by_metadata_id.values())),
+            end_time,
+            list(resume_ts_by_metadata_id),
+            Statistics,
+            types,
+        )
+        if stats := cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        ):
+            hourly_stats = _sorted_statistics_to_dict(
+                hass, stats, None, metadata, True, Statistics, units, types
+            )
+
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id, (key, rollup, resume_ts) in rollups.items():
+        rows: list[StatisticsRow] = []
+        if rollup is not None:
+            rows.extend(
+                row
+                for row in rollup.rows
+                if row["start"] >= start_ts
+                and (end_ts is None or row["start"] < end_ts)
+            )
+        reduced: list[StatisticsRow] = []
+        if hourly := [
+            row
+            for row in hourly_stats.get(statistic_id, ())
+            if row["start"] >= resume_ts
+        ]:
+            reduced = _reduce_statistics(
+                {statistic_id: hourly},
+                same_period,
+                period_start_end,
+                period_duration,
+                types,
+            )[statistic_id]
+            rows.extend(reduced)
+        if rows:
+            # The rows are copied since the caller may modify them
+            result[statistic_id] = [row.copy() for row in rows]
+        if complete_end_ts > resume_ts:
+            completed = [row for row in reduced if row["end"] <= complete_end_ts]
+            rollup_cache.set(
+                key,
+                StatisticsRollup(start_ts, complete_end_ts, completed)
+                if rollup is None
+                else StatisticsRollup(
+                    rollup.start_ts, complete_end_ts, [*rollup.rows, *completed]
+                ),
+                generation,
+            )
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1768,35 +2048,42 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if metadata_ids is not None and period in _PERIOD_REDUCERS:
+        result = _reduced_statistics_during_period(
+            hass, session, start_time, end_time, metadata, period, units, types
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2182,11 +2469,8 @@ def _sorted_statistics_to_dict(
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
         if convert_units:
-            state_unit = unit = metadata_by_id["unit_of_measurement"]
-            if state := hass.states.get(statistic_id):
-                state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
+            convert = _get_display_unit_converter_for_statistic(
+                hass, metadata_by_id, units
             )
         else:
             convert = None
@@ -2367,6 +2651,12 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_ROLLUP_CACHE)
+def get_statistics_rollup_cache(hass: HomeAssistant) -> StatisticsRollupCache:
+    """Get the statistics rollup cache."""
+    return StatisticsRollupCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2432,9 +2722,12 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        result = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    if table == Statistics:
+        get_statistics_rollup_cache(instance.hass).evict((metadata["statistic_id"],))
+    return result
 
 
 @retryable_database_job("adjust_statistics")
@@ -2475,6 +2768,7 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+    get_statistics_rollup_cache(instance.hass).evict((statistic_id,))
 
     return True
 
@@ -2543,6 +2837,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_rollup_cache(instance.hass).evict((statistic_id,))
 
 
 @callback
@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..executor import format_latency_histogram
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -63,6 +64,22 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
     db_stats: dict[str, Any] = {}
+    state_attributes_manager = instance.state_attributes_manager
+    cache_stats = {
+        "state_attributes_cache_hits": state_attributes_manager.cache_hits,
+        "state_attributes_cache_misses": state_attributes_manager.cache_misses,
+    }
+    db_executor_stats = instance.db_executor_stats
+    executor_stats = {
+        "database_executor_queue_depth": db_executor_stats.queue_depth,
+        "database_executor_cancelled_jobs": db_executor_stats.cancelled,
+        "database_executor_wait_time": format_latency_histogram(
+            db_executor_stats.wait_time
+        ),
+        "database_executor_run_time": format_latency_histogram(
+            db_executor_stats.run_time
+        ),
+    }
 
     if instance.async_db_ready.done():
         db_stats = await instance.async_add_executor_job(
@@ -72,4 +89,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | cache_stats | executor_stats
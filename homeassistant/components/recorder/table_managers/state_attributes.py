@@ -12,7 +12,7 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from ..db_schema import StateAttributes
+from ..db_schema import StateAttributes, States
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -37,6 +37,9 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._unresolved: dict[str, tuple[int, list[States]]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -67,6 +70,64 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def link_state(
+        self, dbstate: States, shared_attrs: str, shared_attrs_bytes: bytes
+    ) -> None:
+        """Link a state to the StateAttributes matching shared_attrs.
+
+        If the attributes_id is not pending or cached, the lookup is
+        deferred to resolve_unresolved so all the misses of a commit
+        are looked up in the database with a single query.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if pending_state_attributes := self._pending.get(shared_attrs):
+            self.cache_hits += 1
+            dbstate.state_attributes = pending_state_attributes
+        elif attributes_id := self._id_map.get(shared_attrs):
+            self.cache_hits += 1
+            dbstate.attributes_id = attributes_id
+        elif unresolved := self._unresolved.get(shared_attrs):
+            self.cache_hits += 1
+            unresolved[1].append(dbstate)
+        else:
+            self.cache_misses += 1
+            self._unresolved[shared_attrs] = (
+                StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+                [dbstate],
+            )
+
+    @property
+    def has_unresolved(self) -> bool:
+        """Return if there are states waiting for their attributes_id."""
+        return bool(self._unresolved)
+
+    def resolve_unresolved(
+        self, session: Session
+    ) -> list[tuple[str, int, list[States]]]:
+        """Resolve the attributes_ids of the states linked since the last commit.
+
+        Returns the shared_attrs, hash and states of the attributes
+        that are not in the database yet.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        unresolved = self._unresolved
+        found = self._load_from_hashes(
+            {data_hash for data_hash, _ in unresolved.values()}, session
+        )
+        missing: list[tuple[str, int, list[States]]] = []
+        for shared_attrs, (data_hash, dbstates) in unresolved.items():
+            if attributes_id := found.get(shared_attrs):
+                for dbstate in dbstates:
+                    dbstate.attributes_id = attributes_id
+            else:
+                missing.append((shared_attrs, data_hash, dbstates))
+        unresolved.clear()
+        return missing
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -152,3 +213,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._unresolved.clear()
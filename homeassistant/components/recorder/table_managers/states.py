@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
 
+@cache
+def _insert_columns(model: type[States]) -> tuple[str, ...]:
+    """Return all columns of the states model except the primary key.
+
+    The primary key is generated by the database when the rows are inserted.
+    """
+    return tuple(
+        column.key for column in model.__table__.columns if column.key != "state_id"
+    )
+
+
 class StatesManager:
     """Manage the states table."""
 
@@ -13,6 +30,7 @@ class StatesManager:
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
+        self._pending_writes: list[tuple[str, States]] = []
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -45,6 +63,74 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_write(self, entity_id: str, state: States) -> None:
+        """Add a state to be written in bulk by write_pending.
+
+        The state is not added to the session. The ids of the related
+        pending rows are resolved when the state is written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_writes.append((entity_id, state))
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Return if there are states waiting to be written in bulk."""
+        return bool(self._pending_writes)
+
+    def write_pending(self, session: Session) -> None:
+        """Write all pending states with multi-row inserts.
+
+        SQLAlchemy's unit of work inserts the rows of a self-referential
+        table one at a time, so instead we group the pending states into
+        generations where each entity appears at most once. Each
+        generation is written with a single executemany that returns the
+        generated state_ids, which are then used to link the old_state_id
+        of the next generation.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        generations: list[list[States]] = []
+        depth_by_entity_id: dict[str, int] = {}
+        for entity_id, dbstate in self._pending_writes:
+            depth = depth_by_entity_id.get(entity_id, -1) + 1
+            depth_by_entity_id[entity_id] = depth
+            if depth == len(generations):
+                generations.append([])
+            generations[depth].append(dbstate)
+
+        # Make sure the pending rows in the other tables
+        # have been assigned ids before we reference them
+        session.flush()
+        # Insert with the model the pending states were created
+        # with which is not the current schema for old databases
+        model = type(self._pending_writes[0][1])
+        columns = _insert_columns(model)
+        stmt = insert(model).returning(
+            model.state_id, model.metadata_id, model.entity_id
+        )
+        for generation in generations:
+            dbstates_by_key: dict[tuple[int | None, str | None], States] = {}
+            params: list[dict[str, Any]] = []
+            for dbstate in generation:
+                row = {column: getattr(dbstate, column) for column in columns}
+                if (old_state := dbstate.old_state) is not None:
+                    row["old_state_id"] = old_state.state_id
+                if (state_attributes := dbstate.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                if (states_meta := dbstate.states_meta_rel) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                dbstates_by_key[(row["metadata_id"], row["entity_id"])] = dbstate
+                params.append(row)
+            # The order of the returned rows is not guaranteed for
+            # multi-row inserts so we match them back to the pending
+            # states by metadata_id and entity_id which are unique
+            # within a generation.
+            for state_id, metadata_id, entity_id in session.execute(stmt, params):
+                dbstates_by_key[(metadata_id, entity_id)].state_id = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -65,6 +151,7 @@ class StatesManager:
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
         self._last_reported.clear()
+        self._pending_writes.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -74,6 +161,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_writes.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
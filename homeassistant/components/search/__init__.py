@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from enum import StrEnum
 import logging
 from typing import Any
@@ -93,6 +93,9 @@ class Searcher:
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
         self._entity_sources = entity_sources
+        self._reverse_indexes: dict[
+            Callable[[HomeAssistant, str], Iterable[str]], dict[str, list[str]]
+        ] = {}
         self.results: defaultdict[ItemType, set[str]] = defaultdict(set)
 
     @callback
@@ -119,6 +122,26 @@ class Searcher:
         else:
             self.results[item_type].update(item_id)
 
+    @callback
+    def _async_referencing(
+        self,
+        domain: str,
+        references_in: Callable[[HomeAssistant, str], Iterable[str]],
+        referenced_id: str,
+    ) -> list[str]:
+        """Return the automations or scripts referencing an item.
+
+        A search can visit many items, so instead of scanning all
+        automations or scripts for each of them, a reverse index of
+        their references is built the first time it is needed.
+        """
+        if (index := self._reverse_indexes.get(references_in)) is None:
+            index = self._reverse_indexes[references_in] = defaultdict(list)
+            for entity_id in self.hass.states.async_entity_ids(domain):
+                for reference in references_in(self.hass, entity_id):
+                    index[reference].append(entity_id)
+        return index.get(referenced_id, [])
+
     @callback
     def _async_search_area(self, area_id: str, *, entry_point: bool = True) -> None:
         """Find results for an area."""
@@ -131,11 +154,17 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._async_referencing(
+                automation.DOMAIN, automation.areas_in_automation, area_id
+            ),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._async_referencing(script.DOMAIN, script.areas_in_script, area_id),
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -151,11 +180,18 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._async_referencing(
+                    automation.DOMAIN, automation.devices_in_automation, device.id
+                ),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._async_referencing(
+                    script.DOMAIN, script.devices_in_script, device.id
+                ),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -177,13 +213,19 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._async_referencing(
+                    automation.DOMAIN,
+                    automation.entities_in_automation,
+                    entity_entry.entity_id,
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._async_referencing(
+                    script.DOMAIN, script.entities_in_script, entity_entry.entity_id
+                ),
             )
 
             # Groups that have this entity as a member
@@ -304,11 +346,16 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.devices_in_automation, device_id
+            ),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._async_referencing(script.DOMAIN, script.devices_in_script, device_id),
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -331,11 +378,18 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.entities_in_automation, entity_id
+            ),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._async_referencing(
+                script.DOMAIN, script.entities_in_script, entity_id
+            ),
+        )
 
         # Groups that have this entity as a member
         self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
@@ -352,11 +406,16 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.floors_in_automation, floor_id
+            ),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._async_referencing(script.DOMAIN, script.floors_in_script, floor_id),
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -372,12 +431,17 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.entities_in_automation, group_entity_id
+            ),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._async_referencing(
+                script.DOMAIN, script.entities_in_script, group_entity_id
+            ),
         )
 
         # Scenes that reference this group
@@ -412,11 +476,16 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.labels_in_automation, label_id
+            ),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._async_referencing(script.DOMAIN, script.labels_in_script, label_id),
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -429,12 +498,17 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.entities_in_automation, person_entity_id
+            ),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._async_referencing(
+                script.DOMAIN, script.entities_in_script, person_entity_id
+            ),
         )
 
         # Add all member entities of this person
@@ -453,12 +527,17 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._async_referencing(
+                automation.DOMAIN, automation.entities_in_automation, scene_entity_id
+            ),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._async_referencing(
+                script.DOMAIN, script.entities_in_script, scene_entity_id
+            ),
         )
 
         # Add all entities in this scene
@@ -6,7 +6,6 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -108,33 +107,35 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
+    # Work with timestamps since the states from the recorder
+    # have to create a datetime object for last_updated
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time_ts: float | None = None
     accumulated = 0.0
 
     for fstate, state in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
+        start_time_ts = max(state.last_updated_timestamp, start_ts)
+        if old_start_time_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time_ts
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * (start_time_ts - old_start_time_ts)
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_time_ts = start_time_ts
 
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_time_ts is not None
+        accumulated += old_fstate * (end_ts - old_start_time_ts)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -525,14 +526,15 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if (
+            "max" in wanted_statistics[entity_id]
+            or "min" in wanted_statistics[entity_id]
+        ):
+            values = [fstate for fstate, _ in valid_float_states]
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(values)
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(values)
 
         if "mean" in wanted_statistics[entity_id]:
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
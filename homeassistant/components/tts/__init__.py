@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -40,13 +40,20 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -122,6 +129,20 @@ _RE_VOICE_FILE = re.compile(
 )
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Upper bounds of the memory and file caches, the least recently
+# used voices are evicted when a cache grows larger.
+MEM_CACHE_MAX_SIZE = 2**20 * 50  # 50MB
+FILE_CACHE_MAX_SIZE = 2**30  # 1GB
+
+# Voices from the file cache used at least this often are loaded
+# into memory on startup, up to PREFETCH_MAX_SIZE bytes.
+PREFETCH_MIN_HITS = 3
+PREFETCH_MAX_SIZE = 2**20 * 10  # 10MB
+
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
@@ -133,6 +154,14 @@ class TTSCache(TypedDict):
     pending: asyncio.Task | None
 
 
+class TTSCacheFile(TypedDict):
+    """TTS file in the file cache."""
+
+    filename: str
+    size: int
+    hits: int
+
+
 @callback
 def async_default_engine(hass: HomeAssistant) -> str | None:
     """Return the domain or entity id of the default engine.
@@ -537,39 +566,213 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
-        self.file_cache: dict[str, str] = {}
+        # Both caches are ordered from least to most recently used
+        self.file_cache: dict[str, TTSCacheFile] = {}
         self.mem_cache: dict[str, TTSCache] = {}
-
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+        self._file_cache_size = 0
+        self._mem_cache_size = 0
+        self._mem_cache_timers: dict[str, CALLBACK_TYPE] = {}
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._cache_dir_mtime: int | None = None
+        self._cache_dir_changes = 0
+        self._memory_hits = 0
+        self._file_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _init_cache(self, index: dict[str, Any] | None) -> dict[str, TTSCacheFile]:
+        """Init cache folder and fetch files.
+
+        The index of the file cache is used as is if the cache folder
+        was not modified since the index was saved. Otherwise the cache
+        folder is scanned: files of the index that were removed are
+        dropped and files missing from the index, for example because
+        they were written right before a crash, are added as the least
+        recently used files.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        self._cache_dir_mtime = _get_cache_dir_mtime(self.cache_dir)
+        indexed: dict[str, TTSCacheFile] = {}
+        if index is not None and index["cache_dir"] == self.cache_dir:
+            indexed = {
+                entry["cache_key"]: {
+                    "filename": entry["filename"],
+                    "size": entry["size"],
+                    "hits": entry["hits"],
+                }
+                for entry in index["files"]
+            }
+            if (
+                self._cache_dir_mtime is not None
+                and index.get("cache_dir_mtime") == self._cache_dir_mtime
+            ):
+                return indexed
+
         try:
-            return _get_cache_files(self.cache_dir)
+            cache_files = _get_cache_files(self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
+        file_cache: dict[str, TTSCacheFile] = {}
+        for cache_key, filename in cache_files.items():
+            if cache_key in indexed:
+                continue
+            try:
+                size = os.path.getsize(os.path.join(self.cache_dir, filename))
+            except OSError:
+                continue
+            file_cache[cache_key] = {"filename": filename, "size": size, "hits": 0}
+        file_cache.update(
+            (cache_key, cached_file)
+            for cache_key, cached_file in indexed.items()
+            if cache_key in cache_files
+        )
+        return file_cache
+
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._store.async_load()
+        self.file_cache.update(
+            await self.hass.async_add_executor_job(self._init_cache, index)
+        )
+        self._file_cache_size = sum(
+            cached_file["size"] for cached_file in self.file_cache.values()
+        )
+        if (
+            index is None
+            or index["cache_dir"] != self.cache_dir
+            or index.get("cache_dir_mtime") != self._cache_dir_mtime
+            or len(index["files"]) != len(self.file_cache)
+        ):
+            self._async_schedule_save()
+        await self._async_evict_file_cache()
+
+        if prefetch := self._async_get_prefetch_keys():
+            self.hass.async_create_background_task(
+                self._async_prefetch(prefetch), "tts prefetch", eager_start=False
+            )
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
+        for cancel in self._mem_cache_timers.values():
+            cancel()
+        self._mem_cache_timers = {}
         self.mem_cache = {}
+        self._mem_cache_size = 0
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
-        await self.hass.async_add_executor_job(remove_files)
+        filenames = {
+            cached_file["filename"] for cached_file in self.file_cache.values()
+        }
         self.file_cache = {}
+        self._file_cache_size = 0
+        self._async_schedule_save()
+
+        def remove_files() -> None:
+            """Remove the indexed and the unindexed files."""
+            try:
+                filenames.update(_get_cache_files(self.cache_dir).values())
+            except OSError as err:
+                _LOGGER.warning("Can't read cache dir: %s", err)
+            self._remove_files(list(filenames))
+
+        await self._async_change_cache_dir(remove_files)
+
+    def _remove_files(self, filenames: list[str]) -> None:
+        """Remove files from filesystem."""
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError as err:
+                _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+    async def _async_change_cache_dir(self, change: Callable[[], None]) -> None:
+        """Add or remove files of the cache folder in the executor.
+
+        The modification time of the cache folder is saved with the
+        index once no changes are pending, so the cache folder is
+        scanned on the next start if a change did not make it into
+        the index.
+        """
+        self._cache_dir_changes += 1
+        self._cache_dir_mtime = None
+
+        def run_change() -> int | None:
+            """Run the change and return the new modification time."""
+            change()
+            return _get_cache_dir_mtime(self.cache_dir)
+
+        try:
+            cache_dir_mtime = await self.hass.async_add_executor_job(run_change)
+        finally:
+            self._cache_dir_changes -= 1
+        if not self._cache_dir_changes:
+            self._cache_dir_mtime = cache_dir_mtime
+
+    @callback
+    def async_get_cache_stats(self) -> dict[str, int]:
+        """Return statistics of the memory and file caches."""
+        return {
+            "memory_hits": self._memory_hits,
+            "file_hits": self._file_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "memory_entries": len(self.mem_cache),
+            "memory_bytes": self._mem_cache_size,
+            "file_entries": len(self.file_cache),
+            "file_bytes": self._file_cache_size,
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the index of the file cache to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "cache_dir_mtime": self._cache_dir_mtime,
+            "files": [
+                {"cache_key": cache_key, **cached_file}
+                for cache_key, cached_file in self.file_cache.items()
+            ],
+        }
+
+    @callback
+    def _async_get_prefetch_keys(self) -> list[str]:
+        """Return the keys of the most used voices in the file cache."""
+        frequent = sorted(
+            (
+                (cache_key, cached_file)
+                for cache_key, cached_file in self.file_cache.items()
+                if cached_file["hits"] >= PREFETCH_MIN_HITS
+            ),
+            key=lambda item: item[1]["hits"],
+            reverse=True,
+        )
+        prefetch: list[str] = []
+        size = 0
+        for cache_key, cached_file in frequent:
+            if size + cached_file["size"] > PREFETCH_MAX_SIZE:
+                break
+            size += cached_file["size"]
+            prefetch.append(cache_key)
+        return prefetch
+
+    async def _async_prefetch(self, cache_keys: list[str]) -> None:
+        """Load voices from the file cache into memory."""
+        for cache_key in cache_keys:
+            if cache_key in self.mem_cache or cache_key not in self.file_cache:
+                continue
+            try:
+                await self._async_file_to_mem(cache_key)
+            except HomeAssistantError as err:
+                _LOGGER.debug("Can't prefetch %s: %s", cache_key, err)
 
     @callback
     def async_register_legacy_engine(
@@ -646,12 +849,14 @@ class SpeechManager:
         # Is speech already in memory
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
-        # Is file store in file cache
+            self._async_memory_hit(cache_key)
+        # Is file store in file cache, it is served from disk by the view
         elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
+            filename = self.file_cache[cache_key]["filename"]
+            self._async_file_hit(cache_key)
         # Load speech from engine into memory
         else:
+            self._misses += 1
             filename = await self._async_get_tts_audio(
                 engine_instance, cache_key, message, use_cache, language, options
             )
@@ -675,13 +880,16 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            self._async_memory_hit(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            self._async_file_hit(cache_key)
+            await self._async_file_to_mem(cache_key)
+        else:
+            self._misses += 1
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
         extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
@@ -829,7 +1037,7 @@ class SpeechManager:
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
@@ -856,19 +1064,52 @@ class SpeechManager:
                 speech.write(data)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
+            await self._async_change_cache_dir(save_speech)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        hits = 0
+        if (cached_file := self.file_cache.pop(cache_key, None)) is not None:
+            self._file_cache_size -= cached_file["size"]
+            hits = cached_file["hits"]
+        self.file_cache[cache_key] = {
+            "filename": filename,
+            "size": len(data),
+            "hits": hits,
+        }
+        self._file_cache_size += len(data)
+        self._async_schedule_save()
+        await self._async_evict_file_cache()
+
+    async def _async_evict_file_cache(self) -> None:
+        """Remove the least recently used files until the file cache fits."""
+        filenames: list[str] = []
+        # The most recently used file is always kept
+        for cache_key in list(self.file_cache)[:-1]:
+            if self._file_cache_size <= FILE_CACHE_MAX_SIZE:
+                break
+            cached_file = self.file_cache.pop(cache_key)
+            self._file_cache_size -= cached_file["size"]
+            filenames.append(cached_file["filename"])
+
+        if not filenames:
+            return
+
+        self._evictions += len(filenames)
+        _LOGGER.debug("Evicting %s files from the TTS file cache", len(filenames))
+        self._async_schedule_save()
+        await self._async_change_cache_dir(partial(self._remove_files, filenames))
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
 
         This method is a coroutine.
         """
-        if not (filename := self.file_cache.get(cache_key)):
+        if not (cached_file := self.file_cache.get(cache_key)):
             raise HomeAssistantError(f"Key {cache_key} not in file cache!")
 
+        filename = cached_file["filename"]
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
@@ -879,28 +1120,56 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
 
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> None:
+        """Forget a voice file that is missing from the cache folder.
+
+        The voice is generated again the next time it is requested.
+        """
+        if (cached_file := self.file_cache.pop(cache_key, None)) is not None:
+            self._file_cache_size -= cached_file["size"]
+            self._async_schedule_save()
+
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self._mem_cache_size += len(data)
+        self._async_schedule_remove_from_memcache(cache_key)
+
+        # The most recently used voice is always kept
+        for lru_key in list(self.mem_cache)[:-1]:
+            if self._mem_cache_size <= MEM_CACHE_MAX_SIZE:
+                break
+            if self.mem_cache[lru_key]["pending"] is None:
+                self._evictions += 1
+                self._async_remove_from_memcache(lru_key)
+
+    @callback
+    def _async_schedule_remove_from_memcache(self, cache_key: str) -> None:
+        """Set timer to remove a voice from memcache once it is unused."""
+        if (cancel := self._mem_cache_timers.pop(cache_key, None)) is not None:
+            cancel()
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._mem_cache_timers.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
-        async_call_later(
+        self._mem_cache_timers[cache_key] = async_call_later(
             self.hass,
             self.time_memory,
             HassJob(
@@ -910,23 +1179,69 @@ class SpeechManager:
             ),
         )
 
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove a voice from memcache."""
+        if (cancel := self._mem_cache_timers.pop(cache_key, None)) is not None:
+            cancel()
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self._mem_cache_size -= len(cached["voice"])
+
+    @callback
+    def _async_memory_hit(self, cache_key: str) -> None:
+        """Mark a voice in memcache as most recently used."""
+        self._memory_hits += 1
+        self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+        if cache_key in self._mem_cache_timers:
+            self._async_schedule_remove_from_memcache(cache_key)
+        self._async_count_file_use(cache_key)
+
+    @callback
+    def _async_file_hit(self, cache_key: str) -> None:
+        """Mark a file in the file cache as most recently used."""
+        self._file_hits += 1
+        self._async_count_file_use(cache_key)
+
+    @callback
+    def _async_count_file_use(self, cache_key: str) -> None:
+        """Count a use of a voice in the file cache."""
+        if (cached_file := self.file_cache.pop(cache_key, None)) is None:
+            return
+        cached_file["hits"] += 1
+        self.file_cache[cache_key] = cached_file
+        self._async_schedule_save()
+
+    async def async_get_cache_file_path(self, filename: str) -> str | None:
+        """Return the path of a voice file to serve from the file cache.
+
+        Voices that are in memory are not served from disk. A voice file
+        that was removed from the cache folder is dropped from the cache.
+
+        This method is a coroutine.
+        """
+        cache_key = _cache_key_from_filename(filename)
+        if cache_key in self.mem_cache or cache_key not in self.file_cache:
+            return None
+        path = os.path.join(self.cache_dir, self.file_cache[cache_key]["filename"])
+        if not await self.hass.async_add_executor_job(os.path.isfile, path):
+            self._async_remove_from_file_cache(cache_key)
+            return None
+        self._async_file_hit(cache_key)
+        return path
+
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _cache_key_from_filename(filename)
 
-        if cache_key not in self.mem_cache:
+        if cache_key in self.mem_cache:
+            self._async_memory_hit(cache_key)
+        else:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
+            self._async_file_hit(cache_key)
             await self._async_file_to_mem(cache_key)
 
         cached = self.mem_cache[cache_key]
@@ -1000,6 +1315,26 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _cache_key_from_filename(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
+def _get_cache_dir_mtime(cache_dir: str) -> int | None:
+    """Return the modification time of the cache folder."""
+    try:
+        return os.stat(cache_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1073,9 +1408,12 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            # Files that are not in memory are sent from disk with sendfile
+            if (path := await self.tts.async_get_cache_file_path(filename)) is not None:
+                return web.FileResponse(path)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
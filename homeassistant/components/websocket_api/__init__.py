@@ -39,6 +39,7 @@ from .messages import (  # noqa: F401
     event_message,
     result_message,
 )
+from .util import async_cancel_handler_callback  # noqa: F401
 
 DOMAIN: Final = const.DOMAIN
 
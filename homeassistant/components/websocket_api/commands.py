@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -367,9 +368,76 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntityChangesCoalescer:
+    """Coalesce the entity changes for a client that is backlogged.
+
+    Only the state before the first change and the state after the
+    last change of each entity are kept so a client that cannot keep
+    up gets a single message instead of one per intermediate state.
+    """
+
+    __slots__ = ("_connection", "_message_id_as_bytes", "_pending", "_timer")
+
+    def __init__(
+        self, connection: ActiveConnection, message_id_as_bytes: bytes
+    ) -> None:
+        """Initialize the coalescer."""
+        self._connection = connection
+        self._message_id_as_bytes = message_id_as_bytes
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are coalesced changes waiting to be sent."""
+        return bool(self._pending)
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the pending changes."""
+        data = event.data
+        pending = self._pending
+        entity_id = data["entity_id"]
+        if (change := pending.get(entity_id)) is None:
+            pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            pending[entity_id] = (change[0], data["new_state"])
+        if self._timer is None:
+            self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule sending the pending changes."""
+        self._timer = self._connection.hass.loop.call_later(
+            const.STATE_CHANGES_COALESCE_INTERVAL, self._async_flush
+        )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the pending changes once the client caught up."""
+        if self._connection.backlogged:
+            self._async_schedule_flush()
+            return
+        self._timer = None
+        pending = self._pending
+        self._pending = {}
+        self._connection.send_message(
+            messages.coalesced_state_diff_message(self._message_id_as_bytes, pending)
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
 @callback
 def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    connection: ActiveConnection,
+    coalescer: _EntityChangesCoalescer,
     entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
@@ -391,7 +459,14 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    # Once a change is coalesced the following ones must be
+    # coalesced as well to keep them in order
+    if connection.backlogged or coalescer.pending:
+        coalescer.async_add(event)
+        return
+    connection.send_message(
+        messages.cached_state_diff_message(message_id_as_bytes, event)
+    )
 
 
 @callback
@@ -415,17 +490,27 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
+    coalescer = _EntityChangesCoalescer(connection, message_id_as_bytes)
+    unsub_state_changed = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
-            connection.send_message,
+            connection,
+            coalescer,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
         ),
     )
+
+    @callback
+    def _unsub() -> None:
+        """Unsubscribe from entity changes."""
+        unsub_state_changed()
+        coalescer.async_cancel()
+
+    connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
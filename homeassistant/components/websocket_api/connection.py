@@ -42,6 +42,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "backlogged",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +65,8 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Set while the client is not keeping up with the messages we send
+        self.backlogged = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
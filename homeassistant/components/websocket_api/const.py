@@ -34,6 +34,15 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages at which state changes sent to
+# subscribe_entities subscriptions are coalesced until the
+# client has caught up.
+PENDING_MSG_COALESCE_STATE_CHANGES: Final = 512
+
+# How often coalesced state changes are flushed once the
+# client is no longer backlogged.
+STATE_CHANGES_COALESCE_INTERVAL: Final = 0.25
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -25,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE_STATE_CHANGES,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -143,6 +144,8 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    # The client has caught up with the messages
+                    connection.backlogged = False
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -222,6 +225,12 @@ class WebSocketHandler:
             self._release_ready_queue_size = queue_size_after_add
             self._loop.call_soon(self._release_ready_future_or_reschedule)
 
+        if (
+            queue_size_after_add >= PENDING_MSG_COALESCE_STATE_CHANGES
+            and (connection := self._connection) is not None
+        ):
+            connection.backlogged = True
+
         peak_checker_active = self._peak_checker_unsub is not None
 
         if queue_size_after_add <= PENDING_MSG_PEAK:
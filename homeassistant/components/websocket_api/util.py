@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from aiohttp import web
 
+from homeassistant.core import CALLBACK_TYPE, callback
+
 
 def describe_request(request: web.Request) -> str:
     """Describe a request."""
@@ -11,3 +15,21 @@ def describe_request(request: web.Request) -> str:
     if user_agent := request.headers.get("user-agent"):
         description += f" ({user_agent})"
     return description
+
+
+@callback
+def async_cancel_handler_callback() -> CALLBACK_TYPE:
+    """Return a callback that cancels the running websocket handler.
+
+    Used as the unsubscribe callback of a subscription so the handler
+    stops waiting on any work it is still doing for the client.
+    """
+    handler_task = asyncio.current_task()
+
+    @callback
+    def _cancel_handler() -> None:
+        """Cancel the websocket handler."""
+        if handler_task:
+            handler_task.cancel()
+
+    return _cancel_handler
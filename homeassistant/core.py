@@ -1457,10 +1457,45 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
         raise MaxLengthExceeded(event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE)
 
 
+def _async_keyed_jobs(
+    keyed_listeners: dict[str, dict[str, list[HassJob[[Event[Any]], Any]]]],
+    event_data: Mapping[str, Any],
+) -> list[HassJob[[Event[Any]], Any]]:
+    """Return the jobs of the keyed listeners that match the event data."""
+    matches: list[list[HassJob[[Event[Any]], Any]]] = []
+    for data_key, listeners_by_key in keyed_listeners.items():
+        if (value := event_data.get(data_key)) is None:
+            continue
+        if type(value) is str:
+            if key_jobs := listeners_by_key.get(value):
+                matches.append(key_jobs)
+                continue
+            if "," not in value:
+                continue
+            # Some events pass multiple values as a comma separated string
+            value = value.split(",")
+        if isinstance(value, list):
+            matches.extend(
+                key_jobs
+                for item in value
+                if isinstance(item, str) and (key_jobs := listeners_by_key.get(item))
+            )
+    if len(matches) == 1:
+        return matches[0].copy()
+    # A listener must only run once even if it matches multiple keys
+    return list(dict.fromkeys(job for key_jobs in matches for job in key_jobs))
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1503,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[str, list[HassJob[[Event[Any]], Any]]]],
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1484,7 +1523,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            jobs = {
+                job
+                for listeners_by_key in keyed_listeners.values()
+                for key_jobs in listeners_by_key.values()
+                for job in key_jobs
+            }
+            listeners[event_type] = listeners.get(event_type, 0) + len(jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1579,6 +1627,28 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if (
+            event_data is None
+            or (keyed_listeners := self._keyed_listeners.get(event_type)) is None
+            or not (keyed_jobs := _async_keyed_jobs(keyed_listeners, event_data))
+        ):
+            return
+
+        if not event:
+            event = Event(
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+            )
+
+        for keyed_job in keyed_jobs:
+            try:
+                self._hass.async_run_hass_job(keyed_job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", keyed_job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1642,6 +1712,73 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        keys: Mapping[str, str | Iterable[str]],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific keys.
+
+        keys maps event data keys, such as entity_id or device_id, to the
+        values to listen for. The listener runs once for events where the
+        value of one of the data keys, or one of its items if the value is
+        a list or a comma separated string, is one of the values. Events
+        are routed to the listeners with a dict lookup so the cost of
+        firing an event does not grow with the number of listeners.
+        Keyed listeners run after the regular and match-all listeners.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require an event type")
+        data_keys = {
+            data_key: (values,) if isinstance(values, str) else tuple(values)
+            for data_key, values in keys.items()
+        }
+        job: HassJob[[Event[_DataT]], Any] = HassJob(
+            listener, f"listen {event_type} {data_keys}"
+        )
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for data_key, values in data_keys.items():
+            listeners_by_key = keyed_listeners.setdefault(data_key, {})
+            for value in values:
+                if (key_jobs := listeners_by_key.get(value)) is None:
+                    key_jobs = listeners_by_key[value] = []
+                key_jobs.append(job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, data_keys, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_keys: dict[str, tuple[str, ...]],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for data_key, values in data_keys.items():
+                listeners_by_key = keyed_listeners[data_key]
+                for value in values:
+                    listeners_by_key[value].remove(job)
+                    if not listeners_by_key[value]:
+                        del listeners_by_key[value]
+                if not listeners_by_key:
+                    del keyed_listeners[data_key]
+        except (KeyError, ValueError):
+            # KeyError or ValueError if the listener did not exist
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+            return
+        if not keyed_listeners:
+            del self._keyed_listeners[event_type]
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1910,10 +2047,22 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @under_cached_property
+    def attributes_json(self) -> bytes:
+        """Return a JSON string of the attributes of the State.
+
+        The state machine passes it on to the next State of the entity
+        when the attributes did not change so they are only serialized
+        once for all the states that share them.
+        """
+        return json_bytes(self.attributes)
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": json_fragment(self.attributes_json)}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1956,7 +2105,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: json_fragment(self.attributes_json),
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2374,6 +2530,10 @@ class StateMachine:
             timestamp,
         )
         if old_state is not None:
+            if same_attr and (
+                attributes_json := old_state._cache.get("attributes_json")  # noqa: SLF001
+            ):
+                state._cache["attributes_json"] = attributes_json  # noqa: SLF001
             old_state.expire()
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
@@ -654,6 +654,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_VERSION_MAJOR,
             STORAGE_KEY,
             atomic_writes=True,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
 
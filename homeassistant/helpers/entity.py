@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABCMeta
 import asyncio
-from collections import deque
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping
 import dataclasses
 from enum import Enum, IntFlag, auto
@@ -75,6 +75,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_ENTITY_SOURCE_DOMAINS = "entity_info_domains"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +101,21 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+@singleton.singleton(DATA_ENTITY_SOURCE_DOMAINS)
+def _entity_sources_by_domain(hass: HomeAssistant) -> defaultdict[str, dict[str, None]]:
+    """Get the entity ids of the entity sources indexed by domain."""
+    return defaultdict(dict)
+
+
+@callback
+def entity_ids_for_source_domain(hass: HomeAssistant, domain: str) -> list[str]:
+    """Get the entity ids of the entities added by an integration."""
+    if (entity_ids := _entity_sources_by_domain(hass).get(domain)) is None:
+        return []
+    return list(entity_ids)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1455,6 +1471,9 @@ class Entity(
             entity_info["config_entry"] = self.platform.config_entry.entry_id
 
         entity_sources(self.hass)[self.entity_id] = entity_info
+        _entity_sources_by_domain(self.hass)[self.platform.platform_name][
+            self.entity_id
+        ] = None
 
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
@@ -1485,6 +1504,11 @@ class Entity(
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
             del entity_sources(self.hass)[self.entity_id]
+            domain_index = _entity_sources_by_domain(self.hass)
+            platform_name = self.platform.platform_name
+            del domain_index[platform_name][self.entity_id]
+            if not domain_index[platform_name]:
+                del domain_index[platform_name]
 
     @callback
     def _async_registry_updated(
@@ -39,7 +39,10 @@ from homeassistant.core import (
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
-from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.async_ import (
+    get_scheduled_timer_handles,
+    run_callback_threadsafe,
+)
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
@@ -1687,6 +1690,74 @@ def async_track_time_interval(
 track_time_interval = threaded_listener_factory(async_track_time_interval)
 
 
+def _integration_from_module(module: str | None) -> str:
+    """Return the integration a module belongs to."""
+    parts = (module or "").split(".", 3)
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    return "homeassistant"
+
+
+def _timer_integration(target: Any) -> str:
+    """Return the integration that scheduled a timer from its callback."""
+    while True:
+        if isinstance(target, partial):
+            target = target.func
+        elif isinstance(target, HassJob):
+            target = target.target
+        elif isinstance(target, _TrackPointUTCTime):
+            target = target.job
+        elif isinstance(target, _TrackTimeInterval):
+            target = target.action
+        elif (owner := getattr(target, "__self__", None)) is not None:
+            if isinstance(owner, (_TrackPointUTCTime, _TrackTimeInterval)):
+                target = owner
+                continue
+            # Entity platforms and entities are defined in helpers
+            # but belong to the integration providing the platform
+            if isinstance(platform_name := getattr(owner, "platform_name", None), str):
+                return platform_name
+            if isinstance(
+                platform_name := getattr(
+                    getattr(owner, "platform", None), "platform_name", None
+                ),
+                str,
+            ):
+                return platform_name
+            # Such as data update coordinators
+            if isinstance(
+                domain := getattr(getattr(owner, "config_entry", None), "domain", None),
+                str,
+            ):
+                return domain
+            return _integration_from_module(type(owner).__module__)
+        else:
+            return _integration_from_module(getattr(target, "__module__", None))
+
+
+@callback
+def async_get_scheduled_timers_by_integration(hass: HomeAssistant) -> dict[str, int]:
+    """Return how many timers are scheduled in the event loop per integration.
+
+    Timers that are not scheduled by an integration, including the
+    ones scheduled by the helpers for the core, are counted under
+    homeassistant.
+    """
+    counts: defaultdict[str, int] = defaultdict(int)
+    for handle in get_scheduled_timer_handles(hass.loop):
+        if handle.cancelled():
+            continue
+        # pylint: disable-next=protected-access
+        callback_, args = handle._callback, handle._args  # type: ignore[attr-defined] # noqa: SLF001
+        if callback_ is _run_async_call_action:
+            # The HassJob of async_call_later and async_call_at
+            callback_ = args[1]
+        counts[_timer_integration(callback_)] += 1
+    return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+
 @dataclass(slots=True)
 class SunListener:
     """Helper class to help listen to sun events."""
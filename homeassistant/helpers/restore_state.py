@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+from propcache import cached_property
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -35,6 +37,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of a state that did not change is kept when
+# dumping, this avoids rewriting every unchanged state on each dump
+STATE_LAST_SEEN_REFRESH = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +102,37 @@ class StoredState:
         )
 
 
+class _LoadedStoredState(StoredState):
+    """Stored state loaded from storage that is decoded on first use."""
+
+    def __init__(self, json_dict: dict[str, Any]) -> None:
+        """Initialize a loaded stored state."""
+        self._json_dict = json_dict
+
+    @cached_property
+    def state(self) -> State:  # type: ignore[override]
+        """Return the stored state."""
+        return cast(State, State.from_dict(self._json_dict["state"]))
+
+    @cached_property
+    def extra_data(self) -> ExtraStoredData | None:  # type: ignore[override]
+        """Return the extra stored data."""
+        extra_data_dict = self._json_dict.get("extra_data")
+        return RestoredExtraData(extra_data_dict) if extra_data_dict else None
+
+    @cached_property
+    def last_seen(self) -> datetime:  # type: ignore[override]
+        """Return when the state was last seen."""
+        last_seen = self._json_dict["last_seen"]
+        if isinstance(last_seen, str):
+            return cast(datetime, dt_util.parse_datetime(last_seen))
+        return cast(datetime, last_seen)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the dict the stored state was loaded from."""
+        return self._json_dict
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -135,10 +172,11 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped: dict[str, tuple[StoredState, dict[str, Any]]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -163,8 +201,9 @@ class RestoreStateData:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            # States are only decoded once they are restored
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LoadedStoredState(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -178,6 +217,11 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
+        return list(self._async_get_stored_states_by_entity_id().values())
+
+    @callback
+    def _async_get_stored_states_by_entity_id(self) -> dict[str, StoredState]:
+        """Get the states which should be stored by entity_id."""
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
@@ -188,15 +232,15 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
+        stored_states = {
+            entity_id: StoredState(
                 current_states_by_entity_id[entity_id],
                 entity.extra_restore_state_data,
                 now,
             )
             for entity_id, entity in self.entities.items()
             if entity_id in current_states_by_entity_id
-        ]
+        }
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -210,20 +254,53 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            stored_states[entity_id] = stored_state
 
         return stored_states
 
+    @callback
+    def _async_dump_stored_state(
+        self,
+        entity_id: str,
+        stored_state: StoredState,
+        dumped: dict[str, tuple[StoredState, dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Return the dict to store for a stored state.
+
+        The dict of the previous dump is reused if the state did not change
+        so the store only has to write the states that changed.
+        """
+        previous = self._dumped.get(entity_id)
+        if previous is not None and previous[0] is stored_state:
+            dumped[entity_id] = previous
+            return previous[1]
+        as_dict = stored_state.as_dict()
+        if previous is not None:
+            previous_stored_state, previous_as_dict = previous
+            if (
+                previous_stored_state.state is stored_state.state
+                and previous_as_dict["extra_data"] == as_dict["extra_data"]
+                and stored_state.last_seen - previous_stored_state.last_seen
+                < STATE_LAST_SEEN_REFRESH
+            ):
+                dumped[entity_id] = previous
+                return previous_as_dict
+        dumped[entity_id] = (stored_state, as_dict)
+        return as_dict
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        dumped: dict[str, tuple[StoredState, dict[str, Any]]] = {}
+        stored_states = [
+            self._async_dump_stored_state(entity_id, stored_state, dumped)
+            for entity_id, stored_state in (
+                self._async_get_stored_states_by_entity_id().items()
             )
+        ]
+        self._dumped = dumped
+        try:
+            await self.store.async_save(stored_states)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -11,6 +11,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
+import secrets
 from typing import Any
 
 from propcache import cached_property
@@ -49,6 +50,14 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into a new snapshot once it
+# grows past this fraction of the size of the snapshot
+JOURNAL_COMPACT_RATIO = 0.5
+
+_JOURNAL_COPY = 0
+_JOURNAL_INSERT = 1
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -240,10 +249,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         *,
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
         minor_version: int = 1,
         read_only: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, writes after the first one only append the
+        changes since the previous write to a journal next to the file
+        while Home Assistant is running. The journal is compacted into a
+        new snapshot once it grows too large and when Home Assistant stops.
+        Changes are tracked by identity, the data if it is a list or the
+        lists it holds must contain items that are replaced rather than
+        mutated in place.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +278,22 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        self._journal_base: Any = None
+        self._journal_token: str | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -326,6 +355,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +420,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -552,6 +589,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if self._append_journal(data):
+                return
+            data["journal"] = secrets.token_hex(8)
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +603,98 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal:
+            self._start_journal(path, data)
+
+    def _start_journal(self, path: str, data: dict) -> None:
+        """Start a new journal on top of the snapshot that was just written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_token = data["journal"]
+        self._journal_base = _journal_base(data["data"])
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(path)
+
+    def _append_journal(self, data: dict) -> bool:
+        """Append the changes since the previous write to the journal.
+
+        Returns False if a new snapshot must be written instead.
+        """
+        if (
+            self._journal_base is None
+            # A snapshot is written when stopping so the file holds the
+            # full data for readers that do not know about the journal
+            or self.hass.state not in (CoreState.starting, CoreState.running)
+            # Records are written with the same orjson defaults that
+            # save_json uses for the default encoder, other encoders
+            # always write a snapshot
+            or (self._encoder and self._encoder is not json_helper.JSONEncoder)
+            or self._journal_size > self._snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            return False
+        if (record := _journal_record(self._journal_base, data["data"])) is None:
+            return True
+        try:
+            lines = json_helper.json_bytes(record) + b"\n"
+        except TypeError:
+            # Let the snapshot report what could not be serialized
+            return False
+        if not self._journal_size:
+            lines = (
+                json_helper.json_bytes({"journal": self._journal_token}) + b"\n" + lines
+            )
+
+        _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, lines)
+                if self._atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            _LOGGER.debug("Writing journal for %s failed: %s", self.key, err)
+            return False
+
+        self._journal_base = _journal_base(data["data"])
+        self._journal_size += len(lines)
+        return True
+
+    def _replay_journal(self, data: Any) -> Any:
+        """Apply the changes recorded in the journal to the loaded snapshot."""
+        try:
+            with open(self.journal_path, "rb") as fd:
+                lines = fd.read().splitlines()
+        except FileNotFoundError:
+            return data
+        if not isinstance(data, dict) or not (token := data.get("journal")):
+            return data
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = None
+        if header != {"journal": token}:
+            # The journal belongs to an older snapshot
+            _LOGGER.debug("Ignoring stale journal for %s", self.key)
+            return data
+
+        stored = data["data"]
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # Only the last record can be incomplete after an unclean shutdown
+                _LOGGER.warning("Ignoring incomplete journal record for %s", self.key)
+                break
+            stored = _apply_journal_record(stored, record)
+        data["data"] = stored
+        return data
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +707,115 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_base = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _journal_base(data: Any) -> Any:
+    """Return a copy of the written data to compute the next changes against.
+
+    Only the containers are copied, the items are kept to compare by identity.
+    """
+    if isinstance(data, dict):
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return list(data)
+    return None
+
+
+def _journal_list_ops(old: list[Any], new: list[Any]) -> list[list[Any]] | None:
+    """Return the operations that build new from the items in old.
+
+    Runs of items that are still in old are copied by their index range,
+    everything else is inserted. Returns None if the list is unchanged.
+    """
+    if len(old) == len(new) and all(
+        item is old_item for item, old_item in zip(new, old, strict=True)
+    ):
+        return None
+    old_index = {id(item): idx for idx, item in enumerate(old)}
+    ops: list[list[Any]] = []
+    inserted: list[Any] = []
+    start = end = -1
+    for item in new:
+        if (idx := old_index.get(id(item))) is None:
+            if start >= 0:
+                ops.append([_JOURNAL_COPY, start, end])
+                start = end = -1
+            inserted.append(item)
+            continue
+        if inserted:
+            ops.append([_JOURNAL_INSERT, inserted])
+            inserted = []
+        if idx == end:
+            end += 1
+            continue
+        if start >= 0:
+            ops.append([_JOURNAL_COPY, start, end])
+        start, end = idx, idx + 1
+    if start >= 0:
+        ops.append([_JOURNAL_COPY, start, end])
+    if inserted:
+        ops.append([_JOURNAL_INSERT, inserted])
+    return ops
+
+
+def _journal_record(old: dict[str, Any] | list[Any], new: Any) -> dict[str, Any] | None:
+    """Return the journal record that turns old into new.
+
+    Returns None if nothing changed.
+    """
+    if isinstance(old, list) and isinstance(new, list):
+        if (list_ops := _journal_list_ops(old, new)) is None:
+            return None
+        return {"list": list_ops}
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {"replace": new}
+    record: dict[str, Any] = {}
+    set_values: dict[str, Any] = {}
+    splices: dict[str, list[list[Any]]] = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if isinstance(value, list) and isinstance(old_value, list):
+            if (ops := _journal_list_ops(old_value, value)) is not None:
+                splices[key] = ops
+        elif key not in old or (value is not old_value and value != old_value):
+            set_values[key] = value
+    if set_values:
+        record["set"] = set_values
+    if splices:
+        record["splice"] = splices
+    if removed := [key for key in old if key not in new]:
+        record["remove"] = removed
+    return record or None
+
+
+def _apply_journal_list_ops(old: list[Any], ops: list[list[Any]]) -> list[Any]:
+    """Build a list from the items in old."""
+    new: list[Any] = []
+    for op in ops:
+        if op[0] == _JOURNAL_COPY:
+            new.extend(old[op[1] : op[2]])
+        else:
+            new.extend(op[1])
+    return new
+
+
+def _apply_journal_record(data: Any, record: dict[str, Any]) -> Any:
+    """Apply a journal record to the data."""
+    if "replace" in record:
+        return record["replace"]
+    if "list" in record:
+        return _apply_journal_list_ops(data, record["list"])
+    for key, ops in record.get("splice", {}).items():
+        data[key] = _apply_journal_list_ops(data[key], ops)
+    data.update(record.get("set", {}))
+    for key in record.get("remove", ()):
+        data.pop(key, None)
+    return data
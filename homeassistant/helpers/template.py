@@ -12,8 +12,10 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -23,7 +25,7 @@ import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
 from types import CodeType, TracebackType
-from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
+from typing import Any, Concatenate, Literal, NamedTuple, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -45,10 +47,12 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -85,6 +89,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +107,9 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_TEMPLATE_STORE: HassKey[Store[dict[str, Any]]] = HassKey(
+    "template.compiled_template_store"
+)
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -159,6 +167,18 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+# Compiled template code is shared by all templates with the same
+# source. The code of the most recently used sources is kept even
+# when no template uses it anymore so templates that are created
+# again, for example when reloading, are not compiled again.
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+# The compiled template code is saved once startup has settled
+# so the next start does not need to compile the templates again.
+COMPILED_TEMPLATE_STORAGE_KEY = "core.template_code"
+COMPILED_TEMPLATE_STORAGE_VERSION = 1
+COMPILED_TEMPLATE_SAVE_DELAY = 900
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -1366,13 +1386,9 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
 
     # fallback to just returning all entities for a domain
     # pylint: disable-next=import-outside-toplevel
-    from .entity import entity_sources
+    from .entity import entity_ids_for_source_domain
 
-    return [
-        entity_id
-        for entity_id, info in entity_sources(hass).items()
-        if info["domain"] == entry_name
-    ]
+    return entity_ids_for_source_domain(hass, entry_name)
 
 
 def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
@@ -2808,6 +2824,148 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+def _compiled_template_fingerprint() -> str:
+    """Return the fingerprint of the runtime the template code is compiled for."""
+    return f"{MAGIC_NUMBER.hex()}-{jinja2.__version__}-{HA_VERSION}"
+
+
+def _environments(
+    hass: HomeAssistant,
+) -> Generator[tuple[HassKey[TemplateEnvironment], TemplateEnvironment]]:
+    """Return the shared template environments, creating them if needed."""
+    for key, limited, strict in (
+        (_ENVIRONMENT, False, False),
+        (_ENVIRONMENT_LIMITED, True, False),
+        (_ENVIRONMENT_STRICT, False, True),
+    ):
+        if (env := hass.data.get(key)) is None:
+            env = hass.data[key] = TemplateEnvironment(hass, limited, strict)
+        yield key, env
+
+
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the template code compiled during the previous run."""
+    store = hass.data[_COMPILED_TEMPLATE_STORE] = Store(
+        hass,
+        COMPILED_TEMPLATE_STORAGE_VERSION,
+        COMPILED_TEMPLATE_STORAGE_KEY,
+        private=True,
+    )
+
+    @callback
+    def _data_to_save() -> dict[str, Any]:
+        """Return the compiled template code to save."""
+        return {
+            "fingerprint": _compiled_template_fingerprint(),
+            "templates": {
+                key: {
+                    source: base64.b64encode(code).decode()
+                    for source, code in env.template_cache.marshalled().items()
+                }
+                for key, env in _environments(hass)
+            },
+        }
+
+    @callback
+    def _async_schedule_save(_: Any) -> None:
+        """Save the compiled template code once startup has settled."""
+        store.async_delay_save(_data_to_save, COMPILED_TEMPLATE_SAVE_DELAY)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_schedule_save)
+
+    if (
+        not (data := await store.async_load())
+        or data.get("fingerprint") != _compiled_template_fingerprint()
+    ):
+        return
+    templates: dict[str, dict[str, str]] = data["templates"]
+    for key, env in _environments(hass):
+        if codes := templates.get(key):
+            env.template_cache.add_marshalled(
+                {source: base64.b64decode(code) for source, code in codes.items()}
+            )
+
+
+class CompiledTemplateCacheInfo(NamedTuple):
+    """Statistics of a compiled template cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompiledTemplateCache:
+    """Cache of compiled template code keyed by template source.
+
+    Code is kept while any template uses it and the code of the
+    most recently used sources is kept in an LRU. Code saved by
+    a previous run is only unmarshalled when it is first used.
+    """
+
+    __slots__ = ("_in_use", "_recent", "_marshalled", "hits", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self._in_use: weakref.WeakValueDictionary[str, CodeType] = (
+            weakref.WeakValueDictionary()
+        )
+        self._recent: LRU[str, CodeType] = LRU(maxsize)
+        self._marshalled: dict[str, bytes] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str) -> CodeType | None:
+        """Return the compiled code for a template source."""
+        if (code := self._in_use.get(source)) is None:
+            if (code := self._recent.get(source)) is None:
+                if (marshalled := self._marshalled.pop(source, None)) is None:
+                    self.misses += 1
+                    return None
+                try:
+                    code = marshal.loads(marshalled)
+                except (EOFError, ValueError, TypeError):
+                    code = None
+                if type(code) is not CodeType:
+                    self.misses += 1
+                    return None
+            self._in_use[source] = code
+        self._recent[source] = code
+        self.hits += 1
+        return code
+
+    def set(self, source: str, code: CodeType) -> None:
+        """Cache the compiled code of a template source."""
+        self._in_use[source] = code
+        self._recent[source] = code
+
+    def add_marshalled(self, codes: dict[str, bytes]) -> None:
+        """Add the marshalled code saved by a previous run."""
+        self._marshalled.update(codes)
+
+    def marshalled(self) -> dict[str, bytes]:
+        """Return the marshalled code of the cached sources."""
+        codes = {**self._recent, **self._in_use}
+        return {source: marshal.dumps(code) for source, code in codes.items()}
+
+    def cache_info(self) -> CompiledTemplateCacheInfo:
+        """Return the cache statistics."""
+        return CompiledTemplateCacheInfo(
+            self.hits,
+            self.misses,
+            self._recent.get_size(),
+            len(set(self._in_use).union(self._recent.keys())),
+        )
+
+
+@callback
+def compiled_template_cache_info(
+    hass: HomeAssistant,
+) -> dict[str, CompiledTemplateCacheInfo]:
+    """Return the statistics of the compiled template caches."""
+    return {key: env.template_cache.cache_info() for key, env in _environments(hass)}
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2854,9 +3012,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        self.template_cache = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3210,7 +3366,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if isinstance(source, str):
+            self.template_cache.set(source, compiled)
         return compiled
 
 
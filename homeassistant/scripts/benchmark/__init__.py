@@ -5,24 +5,49 @@ from __future__ import annotations
 import argparse
 import asyncio
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
+from itertools import count as iter_count
 import logging
+from multiprocessing import get_context
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
 from timeit import default_timer as timer
+from typing import Any
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import config_entries, core, loader
+from homeassistant.const import EVENT_STATE_CHANGED, __version__
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_dumps
+from homeassistant.helpers.template import Template
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from homeassistant.util.yaml import dump as yaml_dump
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
 
 BENCHMARKS: dict[str, Callable] = {}
 
+DATA_DB_URL = "benchmark_db_url"
+DATA_ENTITY_COUNT = "benchmark_entity_count"
+DATA_LISTENER_COUNT = "benchmark_listener_count"
+DATA_METRICS = "benchmark_metrics"
+DATA_RANDOM = "benchmark_random"
+
+ALL_BENCHMARKS = "all"
+
 
 def run(args):
     """Handle benchmark commandline script."""
@@ -30,25 +55,99 @@ def run(args):
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", choices=[*BENCHMARKS, ALL_BENCHMARKS])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--db-url",
+        help=(
+            "Database URL used by the recorder benchmarks, "
+            "defaults to a temporary SQLite database"
+        ),
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=1000,
+        help="Number of entities used by the scaled benchmarks",
+    )
+    parser.add_argument(
+        "--listeners",
+        type=int,
+        default=10,
+        help="Number of listeners, templates or connections of the scaled benchmarks",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the random data of the benchmarks",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        help=(
+            "Number of times to run the benchmarks, defaults to running "
+            "until interrupted or once when running all benchmarks"
+        ),
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON, one object per line",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
-    print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+    if args.name == ALL_BENCHMARKS:
+        benches = list(BENCHMARKS.values())
+        runs = args.runs or 1
+    else:
+        benches = [BENCHMARKS[args.name]]
+        runs = args.runs
+
+    loop_name = asyncio.get_event_loop_policy().loop_name
+    if args.json:
+        # Keep stdout for the results
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler) and (
+                handler.stream is sys.stdout
+            ):
+                handler.setStream(sys.stderr)
+    else:
+        print("Using event loop:", loop_name)
 
     with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
-
-
-async def run_benchmark(bench):
-    """Run a benchmark."""
+        for _ in iter_count() if runs is None else range(runs):
+            for bench in benches:
+                result = asyncio.run(run_benchmark(bench, args))
+                if args.json:
+                    print(json_dumps({**result, "loop": loop_name}), flush=True)
+                    continue
+                print(f"Benchmark {bench.__name__} done in {result['runtime']}s")
+                for name, value in result["metrics"].items():
+                    print(f"  {name}: {value}")
+
+
+async def run_benchmark(bench, args) -> dict[str, Any]:
+    """Run a benchmark and return the result."""
     hass = core.HomeAssistant("")
+    hass.data[DATA_DB_URL] = args.db_url
+    hass.data[DATA_ENTITY_COUNT] = args.entities
+    hass.data[DATA_LISTENER_COUNT] = args.listeners
+    hass.data[DATA_RANDOM] = random.Random(args.seed)
+    metrics = hass.data[DATA_METRICS] = {}
     runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
+    return {
+        "benchmark": bench.__name__,
+        "runtime": runtime,
+        "metrics": metrics,
+        "entities": args.entities,
+        "listeners": args.listeners,
+        "seed": args.seed,
+        "version": __version__,
+        "python": platform.python_version(),
+    }
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -57,6 +156,11 @@ def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
     return func
 
 
+def record_metric(hass: core.HomeAssistant, name: str, value: float) -> None:
+    """Record a metric of the running benchmark."""
+    hass.data[DATA_METRICS][name] = value
+
+
 @benchmark
 async def fire_events(hass):
     """Fire a million events."""
@@ -308,3 +412,340 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100 state changes of each entity to the recorder database.
+
+    Reports the rows/s for the bulk insert path and for the
+    unit of work path the recorder uses when the database
+    cannot return the generated ids of a multi-row insert.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    entity_count = hass.data[DATA_ENTITY_COUNT]
+    commits = 20
+    updates_per_commit = 5
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+
+    async def _write_states(instance):
+        """Write the state changes and wait for them to be committed."""
+        start = timer()
+        for _ in range(commits):
+            for update in range(updates_per_commit):
+                for idx in range(entity_count):
+                    hass.states.async_set(
+                        f"sensor.power_{idx}", str(update), attributes
+                    )
+            await hass.async_block_till_done()
+            # pylint: disable-next=protected-access
+            instance._async_commit(dt_util.utcnow())  # noqa: SLF001
+            await instance.async_block_till_done()
+        return timer() - start
+
+    rows = entity_count * commits * updates_per_commit
+    loader.async_setup(hass)
+    recorder_helper.async_initialize_recorder(hass)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        recorder_config = {}
+        if db_url := hass.data[DATA_DB_URL]:
+            recorder_config["db_url"] = db_url
+        assert await async_setup_component(
+            hass, recorder.DOMAIN, {recorder.DOMAIN: recorder_config}
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_recorder_ready.wait()
+        # pylint: disable-next=protected-access
+        bulk_insert_states = instance._bulk_insert_states  # noqa: SLF001
+        # pylint: disable-next=protected-access
+        instance._bulk_insert_states = False  # noqa: SLF001
+        unit_of_work_runtime = await _write_states(instance)
+        record_metric(hass, "unit_of_work_rows_per_second", rows / unit_of_work_runtime)
+        if not bulk_insert_states:
+            # Bulk insert is not supported by the database
+            await hass.async_stop()
+            return unit_of_work_runtime
+        # pylint: disable-next=protected-access
+        instance._bulk_insert_states = True  # noqa: SLF001
+        bulk_runtime = await _write_states(instance)
+        record_metric(hass, "bulk_insert_rows_per_second", rows / bulk_runtime)
+        await hass.async_stop()
+    return bulk_runtime
+
+
+@benchmark
+async def mqtt_wildcard_dispatch(hass):
+    """Dispatch 100k MQTT messages to 500 wildcard subscriptions.
+
+    The message stream mimics zigbee2mqtt and Tasmota devices. The
+    subscription cache is cleared before each message so every message
+    has to be matched against the wildcard subscriptions.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    device_count = 250
+    message_count = 10**5
+    received = 0
+
+    @core.callback
+    def _message_received(msg):
+        nonlocal received
+        received += 1
+
+    client = MQTT(hass, None, {})
+    # pylint: disable-next=protected-access
+    client._mqtt_data = MqttData(client, [])  # noqa: SLF001
+    for idx in range(device_count):
+        client.async_subscribe(f"tele/tasmota_{idx:06X}/+", _message_received, 0)
+        client.async_subscribe(f"zigbee2mqtt/device_{idx}/#", _message_received, 0)
+
+    topics = [
+        *(f"tele/tasmota_{idx:06X}/SENSOR" for idx in range(device_count)),
+        *(f"stat/tasmota_{idx:06X}/RESULT" for idx in range(device_count)),
+        *(f"zigbee2mqtt/device_{idx}" for idx in range(device_count)),
+        *(f"zigbee2mqtt/device_{idx}/availability" for idx in range(device_count)),
+    ]
+    messages = []
+    for idx in range(message_count):
+        msg = MQTTMessage(topic=topics[(idx * 7919) % len(topics)].encode())
+        msg.payload = b'{"state":"ON"}'
+        messages.append(msg)
+
+    # pylint: disable-next=protected-access
+    matching_subscriptions = client._matching_subscriptions  # noqa: SLF001
+    # pylint: disable-next=protected-access
+    on_message = client._async_mqtt_on_message  # noqa: SLF001
+    start = timer()
+    for msg in messages:
+        matching_subscriptions.cache_clear()
+        on_message(None, None, msg)
+    runtime = timer() - start
+    client.cleanup()
+    record_metric(hass, "received", received)
+    record_metric(hass, "messages_per_second", message_count / runtime)
+    return runtime
+
+
+@benchmark
+async def fire_events_internal(hass):
+    """Fire 100k events to each of the listeners."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listener_count = hass.data[DATA_LISTENER_COUNT]
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for _ in range(listener_count):
+        hass.bus.async_listen(event_name, listener)
+
+    async_fire_internal = hass.bus.async_fire_internal
+    start = timer()
+
+    for _ in range(events_to_fire):
+        async_fire_internal(event_name)
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    assert count == events_to_fire * listener_count
+    record_metric(hass, "events_per_second", events_to_fire / runtime)
+    return runtime
+
+
+@benchmark
+async def set_states(hass):
+    """Set 10 random states of each entity."""
+    rounds = 10
+    rng = hass.data[DATA_RANDOM]
+    entity_ids = [f"sensor.power_{idx}" for idx in range(hass.data[DATA_ENTITY_COUNT])]
+    rounds_values = [
+        [str(rng.randint(0, 100)) for _ in entity_ids] for _ in range(rounds)
+    ]
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+
+    async_set_internal = hass.states.async_set_internal
+    start = timer()
+
+    for values in rounds_values:
+        timestamp = time.time()
+        for entity_id, value in zip(entity_ids, values, strict=True):
+            async_set_internal(
+                entity_id, value, attributes, False, None, None, timestamp
+            )
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    record_metric(hass, "states_per_second", rounds * len(entity_ids) / runtime)
+    return runtime
+
+
+@benchmark
+async def template_render_tracking(hass):
+    """Track templates through 10k random state changes.
+
+    Each of the listeners tracks a template that sums the states
+    of 10 random entities.
+    """
+    rng = hass.data[DATA_RANDOM]
+    entity_ids = [f"sensor.power_{idx}" for idx in range(hass.data[DATA_ENTITY_COUNT])]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+    updates = 0
+
+    @core.callback
+    def _refresh(event, track_template_results):
+        """Handle template result changes."""
+        nonlocal updates
+        updates += 1
+
+    for _ in range(hass.data[DATA_LISTENER_COUNT]):
+        terms = " + ".join(
+            f"states('{entity_id}') | int(0)"
+            for entity_id in rng.sample(entity_ids, min(10, len(entity_ids)))
+        )
+        info = async_track_template_result(
+            hass, [TrackTemplate(Template(f"{{{{ {terms} }}}}", hass), None)], _refresh
+        )
+        info.async_refresh()
+    changes = [(rng.choice(entity_ids), str(idx)) for idx in range(1, 10**4 + 1)]
+    await hass.async_block_till_done()
+    updates = 0
+
+    start = timer()
+
+    for entity_id, value in changes:
+        hass.states.async_set(entity_id, value)
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    record_metric(hass, "updates", updates)
+    record_metric(hass, "state_changes_per_second", len(changes) / runtime)
+    return runtime
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Send 10k random state changes to subscribe_entities connections.
+
+    Each of the listeners is a connection subscribed to all entities.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import websocket_api
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.http import WebSocketAdapter
+
+    rng = hass.data[DATA_RANDOM]
+    entity_ids = [f"sensor.power_{idx}" for idx in range(hass.data[DATA_ENTITY_COUNT])]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0", {"unit_of_measurement": "W"})
+    connection_count = hass.data[DATA_LISTENER_COUNT]
+    sent = 0
+
+    def _send_message(message):
+        """Count the sent messages."""
+        nonlocal sent
+        sent += 1
+
+    websocket_api.commands.async_register_commands(
+        hass, websocket_api.async_register_command
+    )
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(user, None, ACCESS_TOKEN_EXPIRATION)
+    logger = logging.getLogger(__name__)
+    for idx in range(connection_count):
+        connection = websocket_api.ActiveConnection(
+            WebSocketAdapter(logger, {"connid": idx}),
+            hass,
+            _send_message,
+            user,
+            refresh_token,
+        )
+        connection.async_handle({"id": 1, "type": "subscribe_entities"})
+    changes = [(rng.choice(entity_ids), str(idx)) for idx in range(1, 10**4 + 1)]
+    await hass.async_block_till_done()
+    sent = 0
+
+    start = timer()
+
+    for entity_id, value in changes:
+        hass.states.async_set(entity_id, value, {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    assert sent == len(changes) * connection_count
+    record_metric(hass, "messages_per_second", sent / runtime)
+    return runtime
+
+
+def _bootstrap_runtime(config_dir: str) -> float:
+    """Return how long it takes to set up and start Home Assistant."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import bootstrap as hass_bootstrap
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.runner import RuntimeConfig
+
+    async def _async_bootstrap() -> float:
+        start = timer()
+        hass = await hass_bootstrap.async_setup_hass(
+            RuntimeConfig(config_dir=config_dir, skip_pip=True)
+        )
+        assert hass is not None
+        await hass.async_start()
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
+
+    return asyncio.run(_async_bootstrap())
+
+
+@benchmark
+async def bootstrap(hass):
+    """Set up and start Home Assistant with an input_boolean per entity.
+
+    Home Assistant is started in a new process because bootstrap
+    changes process wide state, the time includes the imports.
+    """
+    config = {
+        "input_boolean": {
+            f"benchmark_{idx}": {} for idx in range(hass.data[DATA_ENTITY_COUNT])
+        }
+    }
+
+    def _write_config(config_dir: str) -> None:
+        """Write the configuration."""
+        with open(
+            os.path.join(config_dir, "configuration.yaml"), "w", encoding="utf-8"
+        ) as fp:
+            fp.write(yaml_dump(config))
+
+    with (
+        tempfile.TemporaryDirectory() as tmpdir,
+        ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor,
+    ):
+        await hass.async_add_executor_job(_write_config, tmpdir)
+        return await hass.loop.run_in_executor(executor, _bootstrap_runtime, tmpdir)
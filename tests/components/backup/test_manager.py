@@ -34,6 +34,7 @@ async def _mock_backup_generation(manager: BackupManager):
         patch(
             "homeassistant.components.backup.manager.SecureTarFile"
         ) as mocked_tarfile,
+        patch("homeassistant.components.backup.manager.create_compressed_inner_tar"),
         patch("pathlib.Path.iterdir", _mock_iterdir),
         patch("pathlib.Path.stat", MagicMock(st_size=123)),
         patch("pathlib.Path.is_file", lambda x: x.name != ".storage"),
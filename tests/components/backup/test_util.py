@@ -0,0 +1,55 @@
+"""Tests for the Backup integration utilities."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import tarfile
+from unittest.mock import patch
+
+from securetar import SecureTarFile
+
+from homeassistant.components.backup.util import create_compressed_inner_tar
+
+
+def test_create_compressed_inner_tar(tmp_path: Path) -> None:
+    """Test the inner tar file is compressed in multiple gzip members."""
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    files = {
+        "small.txt": b"small",
+        "big.bin": bytes(range(256)) * 400,
+    }
+    for name, content in files.items():
+        (data_path / name).write_bytes(content)
+
+    tar_file_path = tmp_path / "backup.tar"
+    with (
+        patch("homeassistant.components.backup.util.COMPRESS_CHUNK_SIZE", 4096),
+        SecureTarFile(tar_file_path, "w", gzip=False) as outer_tar,
+    ):
+        with create_compressed_inner_tar(
+            outer_tar, "./homeassistant.tar.gz"
+        ) as core_tar:
+            core_tar.add(data_path.as_posix(), arcname="data")
+        raw_bytes = b'{"slug": "abc123"}'
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = len(raw_bytes)
+        outer_tar.addfile(tar_info, fileobj=io.BytesIO(raw_bytes))
+
+    with tarfile.open(tar_file_path, "r:") as outer_tar:
+        assert outer_tar.getnames() == ["./homeassistant.tar.gz", "./backup.json"]
+        backup_json = outer_tar.extractfile("./backup.json")
+        assert backup_json is not None
+        assert backup_json.read() == raw_bytes
+        inner_fileobj = outer_tar.extractfile("./homeassistant.tar.gz")
+        assert inner_fileobj is not None
+        compressed = inner_fileobj.read()
+
+    # The data was written as more than one gzip member
+    assert compressed.count(b"\x1f\x8b\x08") > 1
+    with tarfile.open(fileobj=io.BytesIO(compressed), mode="r:gz") as core_tar:
+        for name, content in files.items():
+            member = core_tar.extractfile(f"data/{name}")
+            assert member is not None
+            assert member.read() == content
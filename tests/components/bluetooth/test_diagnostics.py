@@ -132,6 +132,14 @@ async def test_diagnostics(
                     }
                 }
             },
+            "discovery": {
+                "advertisements": ANY,
+                "advertisements_per_second": ANY,
+                "matcher_time": ANY,
+                "callbacks_invoked": ANY,
+                "integration_matcher_cache_hits": ANY,
+                "integration_matcher_cache_misses": ANY,
+            },
             "manager": {
                 "adapters": {
                     "hci0": {
@@ -290,6 +298,14 @@ async def test_diagnostics_macos(
                     "vendor_id": "Unknown",
                 }
             },
+            "discovery": {
+                "advertisements": ANY,
+                "advertisements_per_second": ANY,
+                "matcher_time": ANY,
+                "callbacks_invoked": ANY,
+                "integration_matcher_cache_hits": ANY,
+                "integration_matcher_cache_misses": ANY,
+            },
             "manager": {
                 "adapters": {
                     "Core Bluetooth": {
@@ -483,6 +499,14 @@ async def test_diagnostics_remote_adapter(
                 }
             },
             "dbus": {},
+            "discovery": {
+                "advertisements": ANY,
+                "advertisements_per_second": ANY,
+                "matcher_time": ANY,
+                "callbacks_invoked": ANY,
+                "integration_matcher_cache_hits": ANY,
+                "integration_matcher_cache_misses": ANY,
+            },
             "manager": {
                 "adapters": {
                     "hci0": {
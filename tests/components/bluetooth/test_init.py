@@ -774,6 +774,62 @@ async def test_discovery_match_by_manufacturer_id_and_manufacturer_data_start(
         assert len(mock_config_flow.mock_calls) == 0
 
 
+async def test_discovery_match_results_cached_until_content_changes(
+    hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
+) -> None:
+    """Test the match result for an address is reused until the content changes."""
+    mock_bt = [
+        {
+            "domain": "homekit_controller",
+            "manufacturer_id": 76,
+            "manufacturer_data_start": [0x06, 0x02, 0x03],
+        }
+    ]
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init") as mock_config_flow:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        manager = _get_manager()
+        device = generate_ble_device("44:44:33:11:23:45", "lock")
+
+        def _inject(manufacturer_data: dict[int, bytes]) -> None:
+            inject_advertisement(
+                hass,
+                device,
+                generate_advertisement_data(
+                    local_name="lock",
+                    service_uuids=[],
+                    manufacturer_data=manufacturer_data,
+                ),
+            )
+
+        # The bytes of a manufacturer id without a data start
+        # matcher do not change the match result
+        _inject({20: b"\x01"})
+        _inject({20: b"\x02"})
+        _inject({20: b"\x03"})
+        await hass.async_block_till_done()
+        stats = manager.async_discovery_diagnostics()
+        assert stats["advertisements"] == 3
+        assert stats["integration_matcher_cache_misses"] == 1
+        assert stats["integration_matcher_cache_hits"] == 2
+        assert len(mock_config_flow.mock_calls) == 0
+
+        # The bytes of a manufacturer id with a data start matcher do
+        _inject({76: b"\x02"})
+        _inject({76: b"\x06\x02\x03\x99"})
+        await hass.async_block_till_done()
+        stats = manager.async_discovery_diagnostics()
+        assert stats["integration_matcher_cache_misses"] == 3
+        assert stats["integration_matcher_cache_hits"] == 2
+        assert len(mock_config_flow.mock_calls) == 1
+        assert mock_config_flow.mock_calls[0][1][0] == "homekit_controller"
+
+
 @pytest.mark.usefixtures("macos_adapter")
 async def test_discovery_match_by_service_data_uuid_then_others(
     hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
@@ -110,6 +110,38 @@ async def test_hidden_entities_skipped(
     assert result.response.error_code == intent.IntentResponseErrorCode.NO_VALID_TARGETS
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_all_entity_names_cached(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the names of all entities are cached until the registry changes."""
+    entity_registry.async_get_or_create(
+        "light", "demo", "1234", suggested_object_id="kitchen"
+    )
+    hass.states.async_set("light.kitchen", "off")
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+
+    await conversation.async_converse(hass, "turn on kitchen", None, Context(), None)
+    all_entity_names = agent._all_entity_names
+    assert all_entity_names is not None
+    assert "kitchen" in [value.value_out for value in all_entity_names.values]
+
+    await conversation.async_converse(hass, "turn on kitchen", None, Context(), None)
+    assert agent._all_entity_names is all_entity_names
+
+    entity_registry.async_update_entity(
+        "light.kitchen", hidden_by=er.RegistryEntryHider.USER
+    )
+    await hass.async_block_till_done()
+    assert agent._all_entity_names is None
+
+    await conversation.async_converse(hass, "turn on kitchen", None, Context(), None)
+    assert agent._all_entity_names is not None
+    assert "kitchen" not in [
+        value.value_out for value in agent._all_entity_names.values
+    ]
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_exposed_domains(hass: HomeAssistant) -> None:
     """Test that we can't interact with entities that aren't exposed."""
@@ -33,7 +33,7 @@ async def test_converation_trace(
     assert traces
     last_trace = traces[-1].as_dict()
     assert last_trace.get("events")
-    assert len(last_trace.get("events")) == 2
+    assert len(last_trace.get("events")) == 3
     trace_event = last_trace["events"][0]
     assert (
         trace_event.get("event_type") == trace.ConversationTraceEventType.ASYNC_PROCESS
@@ -51,6 +51,12 @@ async def test_converation_trace(
     )
 
     trace_event = last_trace["events"][1]
+    assert (
+        trace_event.get("event_type") == trace.ConversationTraceEventType.AGENT_DETAIL
+    )
+    assert trace_event["data"]["recognize_time"] >= 0
+
+    trace_event = last_trace["events"][2]
     assert trace_event.get("event_type") == trace.ConversationTraceEventType.TOOL_CALL
     assert trace_event.get("data") == {
         "intent_name": "HassListAddItem",
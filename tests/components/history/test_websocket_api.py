@@ -543,6 +543,61 @@ async def test_history_stream_historical_only(
     }
 
 
+@pytest.mark.parametrize("live", [True, False])
+async def test_history_stream_unsubscribe_cancels_query(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    live: bool,
+) -> None:
+    """Test unsubscribing stops waiting for the historical states."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    query_started = asyncio.Event()
+    query_cancelled = asyncio.Event()
+
+    async def _mock_send_historical_states(*args, **kwargs):
+        query_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            query_cancelled.set()
+            raise
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api,
+        "_async_send_historical_states",
+        _mock_send_historical_states,
+    ):
+        message = {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+        if not live:
+            message["end_time"] = dt_util.utcnow().isoformat()
+        await client.send_json(message)
+        response = await client.receive_json()
+        assert response["success"]
+        await query_started.wait()
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await asyncio.wait_for(query_cancelled.wait(), 1)
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
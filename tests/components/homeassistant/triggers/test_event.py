@@ -406,6 +406,44 @@ async def test_if_fires_on_sample_zha_event(
     assert len(service_calls) == 1
 
 
+async def test_if_fires_on_event_routed_by_device_id(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test events are routed to the trigger by device_id."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "hue_event",
+                    "event_data": {"device_id": "abc", "type": "short_release"},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    listeners = hass.bus.async_listeners()["hue_event"]
+
+    hass.bus.async_fire("hue_event", {"device_id": "def", "type": "short_release"})
+    hass.bus.async_fire("hue_event", {"device_id": "abc", "type": "long_release"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 0
+
+    hass.bus.async_fire("hue_event", {"device_id": "abc", "type": "short_release"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert hass.bus.async_listeners().get("hue_event", 0) == listeners - 1
+
+
 async def test_if_not_fires_if_event_data_not_matches(
     hass: HomeAssistant, service_calls: list[ServiceCall]
 ) -> None:
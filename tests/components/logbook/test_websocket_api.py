@@ -1741,6 +1741,128 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.processor.LOGBOOK_CHUNK_SIZE", 2)
+async def test_logbook_stream_past_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are streamed in chunks."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_OFF)
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", state)
+        await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow() - timedelta(microseconds=1)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    chunks: list[list[str]] = []
+    partials: list[bool] = []
+    ranges: list[tuple[float, float]] = []
+    whens: list[list[float]] = []
+    for _ in range(3):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        chunks.append([event["state"] for event in msg["event"]["events"]])
+        partials.append(msg["event"].get("partial", False))
+        ranges.append((msg["event"]["start_time"], msg["event"]["end_time"]))
+        whens.append([event["when"] for event in msg["event"]["events"]])
+
+    assert chunks == [
+        [STATE_ON, STATE_OFF],
+        [STATE_ON, STATE_OFF],
+        [STATE_ON],
+    ]
+    assert partials == [True, True, False]
+    # Each chunk covers its own events and the chunks cover the whole period
+    assert ranges == [
+        (now.timestamp(), whens[0][-1]),
+        (whens[0][-1], whens[1][-1]),
+        (whens[1][-1], end_time.timestamp()),
+    ]
+    for (start, end), chunk_whens in zip(ranges, whens, strict=True):
+        assert all(start <= when <= end for when in chunk_whens)
+
+
+@pytest.mark.parametrize("live", [True, False])
+async def test_logbook_stream_unsubscribe_cancels_query(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    live: bool,
+) -> None:
+    """Test unsubscribing stops waiting for the historical events."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    query_started = asyncio.Event()
+    query_cancelled = asyncio.Event()
+
+    async def _mock_send_historical_events(*args, **kwargs):
+        query_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            query_cancelled.set()
+            raise
+
+    websocket_client = await hass_ws_client()
+    with patch.object(
+        websocket_api,
+        "_async_send_historical_events",
+        _mock_send_historical_events,
+    ):
+        message = {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.small"],
+        }
+        if not live:
+            message["end_time"] = dt_util.utcnow().isoformat()
+        await websocket_client.send_json(message)
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        await query_started.wait()
+
+        await websocket_client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        await asyncio.wait_for(query_cancelled.wait(), 1)
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -2041,6 +2163,9 @@ async def test_logbook_stream_match_multiple_entities(
     )
     hass.bus.async_fire("mock_event", {"entity_id": [f"sensor.any,{entity_id}"]})
     hass.bus.async_fire("mock_event", {"entity_id": ["sensor.no_match", "light.off"]})
+    # Comma separated entity_ids are matched like a list
+    hass.bus.async_fire("mock_event", {"entity_id": f"sensor.any,{entity_id}"})
+    hass.bus.async_fire("mock_event", {"entity_id": "sensor.any,light.off"})
     hass.states.async_set(entity_id, STATE_OFF, context=context)
     await hass.async_block_till_done()
 
@@ -2055,6 +2180,12 @@ async def test_logbook_stream_match_multiple_entities(
             "name": "device name",
             "when": ANY,
         },
+        {
+            "domain": "test",
+            "message": "is on fire",
+            "name": "device name",
+            "when": ANY,
+        },
         {
             "context_domain": "test",
             "context_event_type": "mock_event",
@@ -597,6 +597,41 @@ async def test_subscribe_topic_sys_root(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test overlapping wildcard subscriptions are matched and removed."""
+    await mqtt_mock_entry()
+    unsub_level = await mqtt.async_subscribe(hass, "home/+/state", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "home/#", record_calls)
+    await mqtt.async_subscribe(hass, "+/kitchen/+", record_calls)
+    await mqtt.async_subscribe(hass, "#", record_calls)
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted(call.subscribed_topic for call in recorded_calls) == [
+        "#",
+        "+/kitchen/+",
+        "home/#",
+        "home/+/state",
+    ]
+
+    recorded_calls.clear()
+    unsub_level()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "test-payload")
+    async_fire_mqtt_message(hass, "home", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted((call.topic, call.subscribed_topic) for call in recorded_calls) == [
+        ("home", "#"),
+        ("home/kitchen/state", "#"),
+        ("home/kitchen/state", "+/kitchen/+"),
+    ]
+
+
 async def test_subscribe_topic_sys_root_and_wildcard_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
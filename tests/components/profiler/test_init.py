@@ -264,6 +264,7 @@ async def test_log_scheduled(
     )
 
     assert "Scheduled" in caplog.text
+    assert "Scheduled timers per integration" in caplog.text
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
@@ -460,11 +460,18 @@ def test_entity_metric_with_value_assert_helpers() -> None:
     climate_entity_metric.assert_in_metrics(metrics)
 
 
+@pytest.fixture(name="collect_on_scrape")
+def collect_on_scrape_fixture() -> bool:
+    """Return if the metrics are only updated when scraped."""
+    return False
+
+
 @pytest.fixture(name="client")
 async def setup_prometheus_client(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
     namespace: str,
+    collect_on_scrape: bool,
 ):
     """Initialize an hass_client with Prometheus component."""
     # Reset registry
@@ -476,6 +483,8 @@ async def setup_prometheus_client(
     config = {}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
+    if collect_on_scrape:
+        config[prometheus.CONF_COLLECT_ON_SCRAPE] = True
     assert await async_setup_component(
         hass, prometheus.DOMAIN, {prometheus.DOMAIN: config}
     )
@@ -581,6 +590,70 @@ async def test_view_default_namespace(
     ).withValue(15.6).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_gzip(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view with OpenMetrics and gzip."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=1.0.0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+    assert body[-2] == "# EOF"
+
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(15.6).assert_in_metrics(body)
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [True])
+async def test_collect_on_scrape(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test changes between scrapes are collected when scraped."""
+    data = sensor_entities
+    body = await generate_latest_metrics(client)
+
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(15.6).assert_in_metrics(body)
+
+    for state in (16.1, 16.4, 17.2):
+        set_state_with_entry(hass, data["sensor_1"], state, data["sensor_1_attributes"])
+    await hass.async_block_till_done()
+    body = await generate_latest_metrics(client)
+
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(17.2).assert_in_metrics(body)
+
+    EntityMetric(
+        metric_name="state_change_total",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(4).assert_in_metrics(body)
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -1246,6 +1319,7 @@ async def test_update(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -1384,6 +1458,7 @@ async def test_renaming_entity_name(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_renaming_entity_id(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -1471,6 +1546,7 @@ async def test_renaming_entity_id(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_deleting_entity(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -1558,6 +1634,7 @@ async def test_deleting_entity(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_disabling_entity(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
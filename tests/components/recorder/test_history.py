@@ -5,7 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -1014,3 +1014,160 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_significant_states_minimal_compressed_from_cache(
+    hass: HomeAssistant,
+) -> None:
+    """Test minimal compressed states from the history cache match the database."""
+    instance = recorder.get_instance(hass)
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [
+        "media_player.test",
+        "media_player.test3",
+        "thermostat.test",
+        "sensor.not_recorded",
+    ]
+
+    def _get_states(start_time: datetime) -> dict:
+        with session_scope(hass=hass, read_only=True) as session:
+            return history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                four,
+                entity_ids,
+                include_start_time_state=True,
+                significant_changes_only=True,
+                minimal_response=True,
+                no_attributes=True,
+                compressed_state_format=True,
+            )
+
+    start_time = zero + timedelta(seconds=2)
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    cache = instance.history_cache
+    assert cache.get_minimal_compressed_states(
+        start_time.timestamp(), four.timestamp(), entity_ids, entity_id_to_metadata_id
+    )
+    # Nothing was recorded before zero so the cache cannot answer
+    assert (
+        cache.get_minimal_compressed_states(
+            zero.timestamp(), four.timestamp(), entity_ids, entity_id_to_metadata_id
+        )
+        is None
+    )
+
+    from_cache = await instance.async_add_executor_job(_get_states, start_time)
+    assert from_cache["media_player.test"] == [
+        {"s": "YouTube", "lu": start_time.timestamp()},
+        {"s": "Netflix", "lu": (zero + timedelta(seconds=3)).timestamp()},
+    ]
+    with patch.object(cache, "get_minimal_compressed_states", return_value=None):
+        from_db = await instance.async_add_executor_job(_get_states, start_time)
+    assert from_cache == from_db
+    assert list(from_cache) == list(from_db)
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_max_states": 12}])
+async def test_history_cache_evicts_over_max_states(hass: HomeAssistant) -> None:
+    """Test the history cache evicts entities over its limit and uses the database."""
+    instance = recorder.get_instance(hass)
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [
+        "media_player.test",
+        "media_player.test2",
+        "media_player.test3",
+        "thermostat.test",
+        "thermostat.test2",
+    ]
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    cache = instance.history_cache
+    assert cache._size <= 12
+    evicted_entity_ids = [
+        entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id in cache._evicted
+    ]
+    assert "media_player.test" in evicted_entity_ids
+    start_time = zero + timedelta(seconds=2)
+    assert (
+        cache.get_minimal_compressed_states(
+            start_time.timestamp(),
+            four.timestamp(),
+            evicted_entity_ids,
+            entity_id_to_metadata_id,
+        )
+        is None
+    )
+    # The entities that still fit are answered from the cache
+    assert cache.get_minimal_compressed_states(
+        start_time.timestamp(),
+        four.timestamp(),
+        ["media_player.test3"],
+        entity_id_to_metadata_id,
+    )
+
+    def _get_states() -> dict:
+        with session_scope(hass=hass, read_only=True) as session:
+            return history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                four,
+                entity_ids,
+                include_start_time_state=True,
+                significant_changes_only=True,
+                minimal_response=True,
+                no_attributes=True,
+                compressed_state_format=True,
+            )
+
+    with_limit = await instance.async_add_executor_job(_get_states)
+    with patch.object(cache, "get_minimal_compressed_states", return_value=None):
+        from_db = await instance.async_add_executor_job(_get_states)
+    assert with_limit == from_db
+
+
+async def test_history_cache_evicts_purged_states(hass: HomeAssistant) -> None:
+    """Test the history cache does not return states that have been purged."""
+    instance = recorder.get_instance(hass)
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_id = instance.states_meta_manager.get(
+            "media_player.test", session, False
+        )
+    entity_ids = ["media_player.test"]
+    entity_id_to_metadata_id = {"media_player.test": metadata_id}
+    start_time_ts = (zero + timedelta(seconds=2)).timestamp()
+    cache = instance.history_cache
+
+    assert cache.get_minimal_compressed_states(
+        start_time_ts, four.timestamp(), entity_ids, entity_id_to_metadata_id
+    )
+    cache.evict_purged(start_time_ts)
+    assert (
+        cache.get_minimal_compressed_states(
+            start_time_ts, four.timestamp(), entity_ids, entity_id_to_metadata_id
+        )
+        is None
+    )
+    cache.evict_purged_metadata_ids([metadata_id])
+    assert (
+        cache.get_minimal_compressed_states(
+            (zero + timedelta(seconds=4)).timestamp(),
+            None,
+            entity_ids,
+            entity_id_to_metadata_id,
+        )
+        is None
+    )
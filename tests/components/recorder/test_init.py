@@ -136,6 +136,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        history_cache_max_states=1000,
     )
 
 
@@ -360,6 +361,111 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert_states: bool,
+) -> None:
+    """Test saving many states of the same entities in one commit."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "_bulk_insert_states", bulk_insert_states):
+        for state in range(5):
+            for idx in range(3):
+                hass.states.async_set(f"test.recorder_{idx}", str(state), attributes)
+        hass.states.async_remove("test.recorder_2")
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.recorder_0", "5", attributes)
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+        assert len(db_states) == 17
+        attributes_ids = {db_state.attributes_id for db_state, _ in db_states}
+        assert len(attributes_ids) == 2
+        last_state_id: dict[str, int] = {}
+        states: dict[str, list[str | None]] = {}
+        for db_state, entity_id in db_states:
+            assert db_state.old_state_id == last_state_id.get(entity_id)
+            last_state_id[entity_id] = db_state.state_id
+            states.setdefault(entity_id, []).append(db_state.state)
+
+    assert states == {
+        "test.recorder_0": ["0", "1", "2", "3", "4", "5"],
+        "test.recorder_1": ["0", "1", "2", "3", "4"],
+        "test.recorder_2": ["0", "1", "2", "3", "4", None],
+    }
+
+
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_state_attributes_looked_up_once_per_commit(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert_states: bool,
+) -> None:
+    """Test attributes missing from the cache are looked up with one query."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    manager = instance.state_attributes_manager
+    with patch.object(instance, "_bulk_insert_states", bulk_insert_states):
+        hass.states.async_set("test.one", "1", {"unit": "W"})
+        hass.states.async_set("test.two", "1", {"unit": "kWh"})
+        await async_wait_recording_done(hass)
+        # Evict the attributes like a restart would
+        manager._id_map.clear()
+        hits = manager.cache_hits
+        misses = manager.cache_misses
+
+        with patch.object(
+            manager, "_load_from_hashes", wraps=manager._load_from_hashes
+        ) as load_from_hashes_mock:
+            hass.states.async_set("test.one", "2", {"unit": "W"})
+            hass.states.async_set("test.two", "2", {"unit": "kWh"})
+            hass.states.async_set("test.three", "2", {"unit": "W"})
+            hass.states.async_set("test.four", "2", {"unit": "V"})
+            hass.states.async_set("test.five", "2", {"unit": "V"})
+            # Make sure the states are in the session before the commit
+            await async_recorder_block_till_done(hass)
+            await async_wait_recording_done(hass)
+
+    assert load_from_hashes_mock.call_count == 1
+    assert manager.cache_hits - hits == 2
+    assert manager.cache_misses - misses == 3
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StateAttributes).count() == 3
+        attributes_ids_by_state = {
+            (entity_id, state): attributes_id
+            for entity_id, state, attributes_id in session.query(
+                StatesMeta.entity_id, States.state, States.attributes_id
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        }
+    assert (
+        attributes_ids_by_state[("test.one", "1")]
+        == attributes_ids_by_state[("test.one", "2")]
+        == attributes_ids_by_state[("test.three", "2")]
+    )
+    assert (
+        attributes_ids_by_state[("test.two", "1")]
+        == attributes_ids_by_state[("test.two", "2")]
+    )
+    assert attributes_ids_by_state[("test.four", "2")] is not None
+    assert (
+        attributes_ids_by_state[("test.four", "2")]
+        == attributes_ids_by_state[("test.five", "2")]
+    )
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -395,11 +501,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).states_manager.has_pending_writes:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -438,11 +541,8 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).states_manager.has_pending_writes:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -106,6 +106,33 @@ def test_from_event_to_db_state_attributes_with_null() -> None:
     assert decoded["this_attr"] == "withnull"
 
 
+def test_from_event_to_db_state_attributes_uses_attributes_json() -> None:
+    """Test the attributes JSON of the state is reused if nothing is excluded."""
+    state = ha.State("sensor.temperature", "18", {"this_attr": True})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(
+        event, SupportedDialect.MYSQL
+    )
+    assert shared_attrs is state.attributes_json
+
+    state = ha.State(
+        "sensor.temperature", "18", {"this_attr": True, "supported_features": 1}
+    )
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(
+        event, SupportedDialect.MYSQL
+    )
+    assert json_loads(shared_attrs) == {"this_attr": True}
+
+
 def test_repr() -> None:
     """Test converting event to db state repr."""
     attrs = {"this_attr": True}
@@ -338,6 +365,7 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(
         "state": "off",
     }
     assert lstate.last_updated.timestamp() == row.last_updated_ts
+    assert lstate.last_updated_timestamp == row.last_updated_ts
     assert lstate.last_changed.timestamp() == row.last_changed_ts
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
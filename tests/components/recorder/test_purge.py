@@ -110,6 +110,36 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_big_database_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge run stops selecting batches once the time budget is used."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 24),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 24),
+    ):
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        for remaining in (48, 24):
+            finished = purge_old_data(
+                recorder_mock, purge_before, repack=False, time_budget=0
+            )
+            assert not finished
+
+            with session_scope(hass=hass) as session:
+                assert session.query(States).count() == remaining
+
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 24
+            assert session.query(StateAttributes).count() == 1
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -1,7 +1,7 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Literal
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -1844,6 +1844,213 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2022-01-01 00:10:00+00:00")
+async def test_monthly_statistics_rollup_cache(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test completed months are cached until statistics are imported."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+
+    sep_start = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    oct_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    nov_start = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+    dec_start = dt_util.as_utc(dt_util.parse_datetime("2021-12-01 00:00:00"))
+    jan_start = dt_util.as_utc(dt_util.parse_datetime("2022-01-01 00:00:00"))
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": sep_start, "last_reset": None, "state": 0, "sum": 2},
+            {"start": oct_start, "last_reset": None, "state": 1, "sum": 3},
+            {"start": nov_start, "last_reset": None, "state": 2, "sum": 4},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    def monthly_statistics(
+        types: set[Literal["change", "sum"]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        return statistics_during_period(
+            hass,
+            sep_start,
+            None,
+            {"test:total_energy_import"},
+            "month",
+            None,
+            types,
+        )
+
+    expected_stats = {
+        "test:total_energy_import": [
+            {"start": sep_start.timestamp(), "end": oct_start.timestamp(), "sum": 2.0},
+            {"start": oct_start.timestamp(), "end": nov_start.timestamp(), "sum": 3.0},
+            {"start": nov_start.timestamp(), "end": dec_start.timestamp(), "sum": 4.0},
+        ]
+    }
+    assert monthly_statistics({"sum"}) == expected_stats
+    # The compile task tracks the end of the compiled hours
+    assert (
+        statistics.get_statistics_rollup_cache(hass).compiled_end_ts
+        == jan_start.timestamp()
+    )
+
+    # The completed months are served from the cache, only the
+    # hourly statistics after them are read from the database
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=_generate_statistics_during_period_stmt,
+    ) as generate_stmt_mock:
+        assert monthly_statistics({"change"}) == {
+            "test:total_energy_import": [
+                {
+                    "start": sep_start.timestamp(),
+                    "end": oct_start.timestamp(),
+                    "change": 2.0,
+                },
+                {
+                    "start": oct_start.timestamp(),
+                    "end": nov_start.timestamp(),
+                    "change": 1.0,
+                },
+                {
+                    "start": nov_start.timestamp(),
+                    "end": dec_start.timestamp(),
+                    "change": 1.0,
+                },
+            ]
+        }
+        assert monthly_statistics({"sum"}) == expected_stats
+    assert generate_stmt_mock.call_count == 2
+    assert generate_stmt_mock.call_args[0][0] == jan_start
+
+    # Importing statistics evicts the cached months
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": oct_start, "last_reset": None, "state": 1, "sum": 5},),
+    )
+    await async_wait_recording_done(hass)
+    expected_stats["test:total_energy_import"][1]["sum"] = 5.0
+    assert monthly_statistics({"sum"}) == expected_stats
+
+
+def test_statistics_rollup_cache_evicts_least_recently_used() -> None:
+    """Test the rollup cache drops the least recently used rollup when full."""
+    rollup_cache = statistics.StatisticsRollupCache()
+    rollup = statistics.StatisticsRollup(0, 0, [])
+    keys = [
+        (statistic_id, "month", frozenset({"sum"}), None, dt_util.UTC)
+        for statistic_id in ("sensor.one", "sensor.two", "sensor.three")
+    ]
+    with patch.object(statistics, "STATISTICS_ROLLUP_CACHE_SIZE", 2):
+        rollup_cache.set(keys[0], rollup, rollup_cache.generation)
+        rollup_cache.set(keys[1], rollup, rollup_cache.generation)
+        assert rollup_cache.get(keys[0]) is rollup
+        rollup_cache.set(keys[2], rollup, rollup_cache.generation)
+
+    assert rollup_cache.get(keys[0]) is rollup
+    assert rollup_cache.get(keys[1]) is None
+    assert rollup_cache.get(keys[2]) is rollup
+
+
+@pytest.mark.freeze_time("2021-11-02 00:10:00+00:00")
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+async def test_statistics_rollup_cache_unaligned_period(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    period: Literal["day", "week", "month"],
+) -> None:
+    """Test unaligned periods return the same statistics with the rollup cache."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+
+    first_start = dt_util.as_utc(dt_util.parse_datetime("2021-09-20 00:00:00"))
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {
+                "start": first_start + timedelta(hours=hour),
+                "last_reset": None,
+                "state": hour,
+                "sum": hour,
+            }
+            for hour in range(24 * 40)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    def period_statistics(
+        start_time: datetime, end_time: datetime | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        return statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            {"test:total_energy_import"},
+            period,
+            None,
+            {"state", "sum"},
+        )
+
+    def reduced_statistics(
+        start_time: datetime, end_time: datetime | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata = recorder.get_instance(hass).statistics_meta_manager.get_many(
+                session, statistic_ids={"test:total_energy_import"}
+            )
+            return statistics._reduced_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                end_time,
+                metadata,
+                period,
+                None,
+                {"state", "sum"},
+            )
+
+    unaligned_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-02 13:00:00"))
+    unaligned_end = dt_util.as_utc(dt_util.parse_datetime("2021-10-13 07:00:00"))
+    with patch.dict(statistics._PERIOD_REDUCERS, clear=True):
+        uncached = {
+            (start_time, end_time): period_statistics(start_time, end_time)
+            for start_time, end_time in (
+                (unaligned_start, unaligned_end),
+                (unaligned_start, None),
+                (first_start, unaligned_end),
+            )
+        }
+
+    # Fill the rollup cache with unaligned periods first
+    for (start_time, end_time), expected in uncached.items():
+        assert period_statistics(start_time, end_time) == expected
+        assert reduced_statistics(start_time, end_time) == expected
+    for (start_time, end_time), expected in uncached.items():
+        assert period_statistics(start_time, end_time) == expected
+        assert reduced_statistics(start_time, end_time) == expected
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -1,11 +1,15 @@
 """Test recorder system health."""
 
+from concurrent.futures import wait
+import re
+import threading
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.core import MAX_DB_EXECUTOR_WORKERS
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -35,6 +39,12 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache_hits": ANY,
+        "state_attributes_cache_misses": ANY,
+        "database_executor_queue_depth": ANY,
+        "database_executor_cancelled_jobs": ANY,
+        "database_executor_wait_time": ANY,
+        "database_executor_run_time": ANY,
     }
 
 
@@ -64,6 +74,12 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "state_attributes_cache_hits": ANY,
+        "state_attributes_cache_misses": ANY,
+        "database_executor_queue_depth": ANY,
+        "database_executor_cancelled_jobs": ANY,
+        "database_executor_wait_time": ANY,
+        "database_executor_run_time": ANY,
     }
 
 
@@ -99,6 +115,12 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "state_attributes_cache_hits": ANY,
+        "state_attributes_cache_misses": ANY,
+        "database_executor_queue_depth": ANY,
+        "database_executor_cancelled_jobs": ANY,
+        "database_executor_wait_time": ANY,
+        "database_executor_run_time": ANY,
     }
 
 
@@ -127,4 +149,41 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache_hits": ANY,
+        "state_attributes_cache_misses": ANY,
+        "database_executor_queue_depth": ANY,
+        "database_executor_cancelled_jobs": ANY,
+        "database_executor_wait_time": ANY,
+        "database_executor_run_time": ANY,
     }
+
+
+async def test_recorder_system_health_db_executor_stats(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the database executor stats."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    stats = recorder_mock.db_executor_stats
+    run_count = sum(stats.run_time)
+
+    await recorder_mock.async_add_executor_job(lambda: None)
+    assert sum(stats.run_time) == run_count + 1
+
+    # A job cancelled before a worker picked it up
+    db_executor = recorder_mock._db_executor
+    assert db_executor is not None
+    release = threading.Event()
+    busy = [db_executor.submit(release.wait) for _ in range(MAX_DB_EXECUTOR_WORKERS)]
+    queued = db_executor.submit(lambda: None)
+    assert queued.cancel()
+    release.set()
+    await hass.async_add_executor_job(wait, busy)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert info["database_executor_queue_depth"] == 0
+    assert info["database_executor_cancelled_jobs"] == 1
+    assert re.fullmatch(
+        r"<0\.01s: \d+, <0\.1s: \d+, <1s: \d+, <10s: \d+, >=10s: \d+",
+        info["database_executor_run_time"],
+    )
@@ -1,8 +1,11 @@
 """Tests for Search integration."""
 
+from unittest.mock import patch
+
 import pytest
 from pytest_unordered import unordered
 
+from homeassistant.components import automation
 from homeassistant.components.search import ItemType, Searcher
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
@@ -1013,3 +1016,55 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_search_reads_each_automation_once(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the references of each automation are read once per search."""
+    kitchen_area = area_registry.async_create("Kitchen")
+    entity_ids = []
+    for idx in range(3):
+        entity_entry = entity_registry.async_get_or_create(
+            "light", "test", f"light_{idx}", suggested_object_id=f"kitchen_{idx}"
+        )
+        entity_registry.async_update_entity(
+            entity_entry.entity_id, area_id=kitchen_area.id
+        )
+        entity_ids.append(entity_entry.entity_id)
+
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "id": f"light_{idx}",
+                    "alias": f"Light {idx}",
+                    "triggers": {"platform": "state", "entity_id": "sensor.motion"},
+                    "actions": {
+                        "action": "light.turn_on",
+                        "target": {"entity_id": entity_id},
+                    },
+                }
+                for idx, entity_id in enumerate(entity_ids)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.search.automation.entities_in_automation",
+        wraps=automation.entities_in_automation,
+    ) as mock_entities_in_automation:
+        searcher = Searcher(hass, {})
+        results = searcher.async_search(ItemType.AREA, kitchen_area.id)
+
+    assert results[ItemType.AUTOMATION] == {
+        "automation.light_0",
+        "automation.light_1",
+        "automation.light_2",
+    }
+    assert mock_entities_in_automation.call_count == 3
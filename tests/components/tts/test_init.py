@@ -41,6 +41,7 @@ from .common import (
 
 from tests.common import (
     MockModule,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1224,6 +1225,274 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+def _mock_cache_index(
+    hass_storage: dict[str, Any],
+    cache_dir: Path,
+    filename: str,
+    size: int,
+    hits: int,
+    cache_dir_mtime: int | None = None,
+) -> None:
+    """Store an index of the file cache with a single file."""
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(cache_dir),
+            "cache_dir_mtime": cache_dir_mtime,
+            "files": [
+                {
+                    "cache_key": filename.rsplit(".", 1)[0],
+                    "filename": filename,
+                    "size": size,
+                    "hits": hits,
+                }
+            ],
+        },
+    }
+
+
+async def test_load_cache_from_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    mock_tts_get_cache_files: MagicMock,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the file cache is loaded from the index and served from disk."""
+    tts_data = b"voice"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, tts_data
+    )
+    cache_dir_stat = await hass.async_add_executor_job(mock_tts_cache_dir.stat)
+    _mock_cache_index(
+        hass_storage,
+        mock_tts_cache_dir,
+        filename,
+        len(tts_data),
+        0,
+        cache_dir_stat.st_mtime_ns,
+    )
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_tts_get_cache_files.assert_not_called()
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.mem_cache == {}
+
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == tts_data
+
+    assert manager.mem_cache == {}
+    assert manager.async_get_cache_stats() == {
+        "memory_hits": 0,
+        "file_hits": 1,
+        "misses": 0,
+        "evictions": 0,
+        "memory_entries": 0,
+        "memory_bytes": 0,
+        "file_entries": 1,
+        "file_bytes": len(tts_data),
+    }
+
+
+async def test_load_cache_from_index_missing_file(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test files of the index that no longer exist are not loaded."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    _mock_cache_index(hass_storage, mock_tts_cache_dir, filename, 5, 0)
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.file_cache == {}
+    assert manager.async_get_cache_stats()["file_bytes"] == 0
+
+    # The voice is generated again
+    url = await manager.async_get_url_path("tts.test", "There is someone at the door.")
+    assert url == f"/api/tts_proxy/{filename}"
+    assert manager.async_get_cache_stats()["misses"] == 1
+
+
+async def test_load_cache_unindexed_files(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test files missing from the index are loaded and evicted first."""
+    tts_data = b"voice"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    unindexed_filename = f"{'a' * 40}_de-de_-_tts.test.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, tts_data
+    )
+    cache_dir_stat = await hass.async_add_executor_job(mock_tts_cache_dir.stat)
+    _mock_cache_index(
+        hass_storage,
+        mock_tts_cache_dir,
+        filename,
+        len(tts_data),
+        0,
+        cache_dir_stat.st_mtime_ns,
+    )
+    # Written after the index was saved
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / unindexed_filename).write_bytes, tts_data * 2
+    )
+
+    with patch.object(tts, "FILE_CACHE_MAX_SIZE", len(tts_data)):
+        await mock_config_entry_setup(hass, mock_tts_entity)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert list(manager.file_cache) == [filename.rsplit(".", 1)[0]]
+    stats = manager.async_get_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["file_bytes"] == len(tts_data)
+    assert not await hass.async_add_executor_job(
+        (mock_tts_cache_dir / unindexed_filename).exists
+    )
+
+    freezer.tick(tts.SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    cache_dir_stat = await hass.async_add_executor_job(mock_tts_cache_dir.stat)
+    index = hass_storage[tts.STORAGE_KEY]["data"]
+    assert index["cache_dir_mtime"] == cache_dir_stat.st_mtime_ns
+
+
+async def test_clear_cache_unindexed_files(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test clearing the cache removes files missing from the index."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    unindexed_file = mock_tts_cache_dir / f"{'a' * 40}_de-de_-_tts.test.mp3"
+    await hass.async_add_executor_job(unindexed_file.write_bytes, b"voice")
+
+    await hass.services.async_call(
+        tts.DOMAIN, tts.SERVICE_CLEAR_CACHE, {}, blocking=True
+    )
+
+    assert not await hass.async_add_executor_job(unindexed_file.exists)
+
+
+async def test_cache_file_removed_from_disk(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test a file removed from disk is dropped from the cache and generated again."""
+    tts_data = b"voice"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, tts_data
+    )
+    _mock_cache_index(hass_storage, mock_tts_cache_dir, filename, len(tts_data), 0)
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    await hass.async_add_executor_job((mock_tts_cache_dir / filename).unlink)
+
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == HTTPStatus.NOT_FOUND
+    assert manager.file_cache == {}
+    stats = manager.async_get_cache_stats()
+    assert stats["file_hits"] == 0
+    assert stats["file_bytes"] == 0
+
+    url = await manager.async_get_url_path("tts.test", "There is someone at the door.")
+    assert url == f"/api/tts_proxy/{filename}"
+    assert manager.async_get_cache_stats()["misses"] == 1
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+
+
+async def test_prefetch_frequently_used(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test frequently used voices are loaded into memory on startup."""
+    tts_data = b"voice"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, tts_data
+    )
+    _mock_cache_index(
+        hass_storage,
+        mock_tts_cache_dir,
+        filename,
+        len(tts_data),
+        tts.PREFETCH_MIN_HITS,
+    )
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.mem_cache[filename.rsplit(".", 1)[0]]["voice"] == tts_data
+
+
+class MockEntityVoice(MockTTSEntity):
+    """Mock entity with 100 bytes of audio."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Load TTS dat."""
+        return ("mp3", b"voice" * 20)
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockEntityVoice(DEFAULT_LANG)])
+async def test_cache_evicts_least_recently_used(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test the memory and file caches evict the least recently used voices."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch.multiple(tts, MEM_CACHE_MAX_SIZE=150, FILE_CACHE_MAX_SIZE=150):
+        await manager.async_get_tts_audio("tts.test", "first message")
+        await hass.async_block_till_done()
+        await manager.async_get_tts_audio("tts.test", "second message")
+        await hass.async_block_till_done()
+        await manager.async_get_tts_audio("tts.test", "second message")
+
+    files = await hass.async_add_executor_job(list, mock_tts_cache_dir.iterdir())
+    assert [file.name for file in files] == [
+        manager.mem_cache[cache_key]["filename"] for cache_key in manager.mem_cache
+    ]
+    assert manager.async_get_cache_stats() == {
+        "memory_hits": 1,
+        "file_hits": 0,
+        "misses": 2,
+        "evictions": 2,
+        "memory_entries": 1,
+        "memory_bytes": 100,
+        "file_entries": 1,
+        "file_bytes": 100,
+    }
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
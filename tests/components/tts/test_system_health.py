@@ -0,0 +1,37 @@
+"""Test TTS system health."""
+
+from pathlib import Path
+
+from homeassistant.components import tts
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from .common import MockTTSEntity, mock_config_entry_setup
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test system health info reports the cache statistics."""
+    assert await async_setup_component(hass, "system_health", {})
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    await manager.async_get_tts_audio("tts.test", "There is someone at the door.")
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, tts.DOMAIN)
+
+    assert info == {
+        "memory_hits": 0,
+        "file_hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "memory_entries": 1,
+        "memory_bytes": 0,
+        "file_entries": 1,
+        "file_bytes": 0,
+    }
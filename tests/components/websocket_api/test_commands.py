@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -10,6 +11,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant import loader
+from homeassistant.components import websocket_api
 from homeassistant.components.device_automation import toggle_entity
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
@@ -27,6 +29,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +37,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -2865,6 +2869,67 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_subscribe_entities_coalesces_while_backlogged(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test state changes are coalesced while the client is backlogged."""
+    hass.states.async_set("light.changed", "off", {"brightness": 10})
+    hass.states.async_set("light.removed", "on")
+    sent: list[Any] = []
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), hass, sent.append, hass_admin_user, Mock()
+    )
+    connection.async_handle({"id": 5, "type": "subscribe_entities"})
+    sent.clear()
+
+    connection.backlogged = True
+    hass.states.async_set("light.changed", "on", {"brightness": 20})
+    hass.states.async_set("light.changed", "off", {"brightness": 30})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.transient", "on")
+    hass.states.async_remove("light.transient")
+    assert sent == []
+
+    # Still backlogged, nothing is sent
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=const.STATE_CHANGES_COALESCE_INTERVAL),
+    )
+    assert sent == []
+
+    # Changes are not sent out of order while coalesced ones are pending
+    connection.backlogged = False
+    hass.states.async_set("light.added", "off")
+    assert sent == []
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=2 * const.STATE_CHANGES_COALESCE_INTERVAL),
+    )
+    assert len(sent) == 1
+    msg = json_loads(sent[0])
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {"light.changed": {"+": {"a": {"brightness": 30}, "c": ANY, "lc": ANY}}},
+        "r": ["light.removed"],
+    }
+
+    # Back to a message per change once caught up
+    sent.clear()
+    hass.states.async_set("light.added", "on")
+    assert len(sent) == 1
+    assert json_loads(sent[0])["event"] == {
+        "c": {"light.added": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    connection.subscriptions[5]()
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -834,10 +834,16 @@ async def test_setup_source(hass: HomeAssistant) -> None:
             "domain": "test_platform",
         },
     }
+    assert entity.entity_ids_for_source_domain(hass, "test_platform") == [
+        "test_domain.platform_config_source",
+        "test_domain.config_entry_source",
+    ]
+    assert entity.entity_ids_for_source_domain(hass, "other_platform") == []
 
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+    assert entity.entity_ids_for_source_domain(hass, "test_platform") == []
 
 
 async def test_removing_entity_unavailable(hass: HomeAssistant) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from functools import partial
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -30,6 +31,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_scheduled_timers_by_integration,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -4978,3 +4980,47 @@ async def test_async_track_template_result_no_hass_deprecated(
     )
     assert message not in caplog.text
     caplog.clear()
+
+
+async def test_scheduled_timers_by_integration(hass: HomeAssistant) -> None:
+    """Test counting the scheduled timers per integration."""
+
+    def hue_action(now: datetime) -> None:
+        """Run the hue action."""
+
+    def custom_action(now: datetime, extra: str) -> None:
+        """Run the custom integration action."""
+
+    class _Platform:
+        platform_name = "zha"
+
+        def action(self, now: datetime) -> None:
+            """Run the entity platform action."""
+
+    hue_action.__module__ = "homeassistant.components.hue.light"
+    custom_action.__module__ = "custom_components.foo.sensor"
+    before = async_get_scheduled_timers_by_integration(hass)
+
+    unsubs = [
+        async_call_later(hass, 10, hue_action),
+        async_track_time_interval(
+            hass, partial(custom_action, extra="x"), timedelta(seconds=10)
+        ),
+        async_track_point_in_utc_time(
+            hass, _Platform().action, dt_util.utcnow() + timedelta(seconds=10)
+        ),
+        async_call_later(hass, 10, _Platform().action),
+    ]
+    cancelled = async_call_later(hass, 10, hue_action)
+    cancelled()
+
+    after = async_get_scheduled_timers_by_integration(hass)
+    assert {
+        integration: count - before.get(integration, 0)
+        for integration, count in after.items()
+        if count != before.get(integration, 0)
+    } == {"hue": 1, "foo": 1, "zha": 2}
+    assert list(after.values()) == sorted(after.values(), reverse=True)
+
+    for unsub in unsubs:
+        unsub()
@@ -3,6 +3,8 @@
 from collections.abc import Coroutine
 from datetime import datetime, timedelta
 import logging
+import os
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -32,6 +34,7 @@ from tests.common import (
     MockModule,
     MockPlatform,
     async_fire_time_changed,
+    async_test_home_assistant,
     json_round_trip,
     mock_integration,
     mock_platform,
@@ -358,6 +361,103 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_reuses_unchanged_states(hass: HomeAssistant) -> None:
+    """Test that states which did not change are dumped as the same dict."""
+    now = dt_util.utcnow()
+    stored = StoredState(State("input_boolean.b2", "off"), None, now)
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save([stored.as_dict()])
+    hass.data.pop(DATA_RESTORE_STATE)
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        await async_load(hass)
+    data = async_get(hass)
+
+    # Loaded states are only decoded once they are restored
+    loaded = data.last_states["input_boolean.b2"]
+    assert "state" not in loaded.__dict__
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+    hass.states.async_set("input_boolean.b1", "on")
+
+    async def _async_dump() -> list[dict[str, Any]]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    first = await _async_dump()
+    assert "state" not in loaded.__dict__
+    assert first[1] is loaded.as_dict()
+    second = await _async_dump()
+    assert second[0] is first[0]
+    assert second[1] is first[1]
+
+    hass.states.async_set("input_boolean.b1", "off")
+    third = await _async_dump()
+    assert third[0] is not first[0]
+    assert json_round_trip(third[0])["state"]["state"] == "off"
+    assert third[1] is first[1]
+
+    # The last seen time of unchanged states is refreshed eventually
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=1),
+    ):
+        fourth = await _async_dump()
+    assert fourth[0] is not third[0]
+    assert fourth[0]["last_seen"] > third[0]["last_seen"]
+
+    assert loaded.state.state == "off"
+    assert loaded.last_seen == now
+
+
+async def test_dump_states_journal(tmp_path: Path) -> None:
+    """Test changed states are appended to the journal and restored on load."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        data = async_get(hass)
+        platform = MockEntityPlatform(hass, domain="input_boolean")
+        entities = []
+        for idx in range(3):
+            entity = RestoreEntity()
+            entity.hass = hass
+            entity.entity_id = f"input_boolean.b{idx}"
+            entities.append(entity)
+        await platform.async_add_entities(entities)
+        for entity in entities:
+            hass.states.async_set(entity.entity_id, "on")
+
+        await data.async_dump_states()
+        assert not os.path.exists(data.store.journal_path)
+
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        journal = await hass.async_add_executor_job(
+            Path(data.store.journal_path).read_bytes
+        )
+        # The journal header and a record with only the changed state
+        assert len(journal.splitlines()) == 2
+        assert b"input_boolean.b1" in journal
+        assert b"input_boolean.b0" not in journal
+
+        restored = RestoreStateData(hass)
+        await restored.async_load()
+        assert {
+            entity_id: stored_state.state.state
+            for entity_id, stored_state in restored.last_states.items()
+        } == {
+            "input_boolean.b0": "on",
+            "input_boolean.b1": "off",
+            "input_boolean.b2": "on",
+        }
+        await hass.async_stop(force=True)
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
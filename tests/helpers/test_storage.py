@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -1180,3 +1181,142 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx} for idx in range(10)]
+        await store.async_save({"items": list(items), "name": "first"})
+        assert not os.path.exists(store.journal_path)
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+
+        # Replace one item, remove one and add one
+        items[3] = {"id": 3, "changed": True}
+        del items[7]
+        items.append({"id": 10})
+        await store.async_save({"items": list(items), "name": "first"})
+        await store.async_save({"items": list(items), "name": "second"})
+        # Unchanged data does not grow the journal
+        journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+        await store.async_save({"items": list(items), "name": "second"})
+        assert (
+            await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+            == journal
+        )
+        assert len(journal.splitlines()) == 3
+        assert (
+            await hass.async_add_executor_job(Path(store.path).read_bytes) == snapshot
+        )
+
+        expected = {"items": items, "name": "second"}
+        assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+            "items": [{"id": idx} for idx in range(10)],
+            "name": "first",
+        }
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == expected
+        )
+
+        # An incomplete last record is ignored
+        await hass.async_add_executor_job(
+            Path(store.journal_path).write_bytes, journal + b'{"set":{"na'
+        )
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == expected
+        )
+
+        # The first write after loading compacts the journal into a snapshot
+        loaded = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await loaded.async_load() == expected
+        await loaded.async_save(expected)
+        assert not os.path.exists(loaded.journal_path)
+        assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == (
+            expected
+        )
+
+        await loaded.async_remove()
+        assert not os.path.exists(loaded.path)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted once it grows too large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx} for idx in range(100)]
+        await store.async_save({"items": list(items)})
+
+        compacted = False
+        for idx in range(100):
+            items[idx] = {"id": idx, "changed": True}
+            await store.async_save({"items": list(items)})
+            if not os.path.exists(store.journal_path):
+                compacted = True
+                break
+        assert compacted
+
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text(encoding="utf-8")
+        )
+        assert snapshot["data"] == {"items": items}
+
+        # A journal left behind by an older snapshot is not replayed
+        items.append({"id": 100})
+        await store.async_save({"items": list(items)})
+        journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": []})
+        await hass.async_add_executor_job(Path(store.journal_path).write_bytes, journal)
+        assert await store.async_load() == {"items": []}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the final write compacts the journal into a full snapshot."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx} for idx in range(10)]
+        await store.async_save({"items": list(items)})
+        items[5] = {"id": 5, "changed": True}
+        await store.async_save({"items": list(items)})
+        assert os.path.exists(store.journal_path)
+
+        items.append({"id": 10})
+        store.async_delay_save(lambda: {"items": list(items)}, 10)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not os.path.exists(store.journal_path)
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text(encoding="utf-8")
+        )
+        assert snapshot["data"] == {"items": items}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_list_data(tmpdir: py.path.local) -> None:
+    """Test changes to list data are journaled."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx} for idx in range(10)]
+        await store.async_save(list(items))
+        items[5] = {"id": 5, "changed": True}
+        await store.async_save(list(items))
+        assert os.path.exists(store.journal_path)
+
+        loaded = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await loaded.async_load() == items
+        await hass.async_stop(force=True)
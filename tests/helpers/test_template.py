@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -22,6 +24,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -5167,7 +5170,99 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    # The code of recently used templates is kept
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+
+
+async def test_compiled_template_cache() -> None:
+    """Test the compiled template cache keeps code in use and recent code."""
+    cache = template.CompiledTemplateCache(1)
+    in_use = compile("1", "<template>", "eval")
+    cache.set("{{ 1 }}", in_use)
+    cache.set("{{ 2 }}", compile("2", "<template>", "eval"))
+    cache.set("{{ 3 }}", compile("3", "<template>", "eval"))
+
+    assert cache.get("{{ 3 }}") is not None
+    assert cache.get("{{ 2 }}") is None
+    assert cache.cache_info() == template.CompiledTemplateCacheInfo(
+        hits=1, misses=1, maxsize=1, currsize=2
+    )
+    # Code in use is kept even when it is not recent
+    assert cache.get("{{ 1 }}") is in_use
+    assert cache.get("{{ 3 }}") is None
+
+    cache = template.CompiledTemplateCache(1)
+    cache.add_marshalled({"{{ 1 }}": b"invalid", "{{ 2 }}": marshal.dumps(in_use)})
+    assert cache.get("{{ 1 }}") is None
+    assert cache.get("{{ 2 }}") == in_use
+
+
+async def test_compiled_template_persistence(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is saved and loaded."""
+    code = template.TemplateEnvironment(hass).compile("{{ 1 + 1 }}")
+    hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY] = {
+        "version": template.COMPILED_TEMPLATE_STORAGE_VERSION,
+        "data": {
+            "fingerprint": template._compiled_template_fingerprint(),
+            "templates": {
+                "template.environment": {
+                    "{{ 1 + 1 }}": base64.b64encode(marshal.dumps(code)).decode()
+                }
+            },
+        },
+    }
+    await template.async_load_compiled_templates(hass)
+
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    tpl = template.Template("{{ 2 + 2 }}", hass)
+    assert tpl.async_render() == 4
+    assert template.compiled_template_cache_info(hass)[
+        "template.environment"
+    ] == template.CompiledTemplateCacheInfo(
+        hits=1, misses=1, maxsize=template.COMPILED_TEMPLATE_CACHE_SIZE, currsize=2
+    )
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILED_TEMPLATE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    saved = hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY]["data"]
+    assert saved["fingerprint"] == template._compiled_template_fingerprint()
+    assert set(saved["templates"]["template.environment"]) == {
+        "{{ 1 + 1 }}",
+        "{{ 2 + 2 }}",
+    }
+
+
+async def test_compiled_template_persistence_version_change(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code of another version is not used."""
+    code = template.TemplateEnvironment(hass).compile("{{ 1 + 1 }}")
+    hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY] = {
+        "version": template.COMPILED_TEMPLATE_STORAGE_VERSION,
+        "data": {
+            "fingerprint": "other",
+            "templates": {
+                "template.environment": {
+                    "{{ 1 + 1 }}": base64.b64encode(marshal.dumps(code)).decode()
+                }
+            },
+        },
+    }
+    await template.async_load_compiled_templates(hass)
+
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    assert (
+        template.compiled_template_cache_info(hass)["template.environment"].misses == 1
+    )
 
 
 def test_is_template_string() -> None:
@@ -19,6 +19,7 @@ from homeassistant.const import (
     BASE_PLATFORMS,
     CONF_DEBUG,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
@@ -1524,3 +1525,62 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_startup_platforms_saved(hass: HomeAssistant) -> None:
+    """Test the imported platforms are recorded in import order."""
+    hass.data[loader.DATA_COMPONENTS] = {
+        "hue": Mock(),
+        "hue.light": Mock(),
+        "zha": Mock(),
+        "hue.sensor": Mock(),
+        "zha.switch": Mock(),
+    }
+    assert bootstrap._async_startup_platforms_to_save(hass) == {
+        "ha_version": __version__,
+        "platforms": {"hue": ["light", "sensor"], "zha": ["switch"]},
+    }
+
+
+@pytest.mark.parametrize(
+    ("ha_version", "imported"),
+    [(__version__, [["light"]]), ("2020.1.0", [])],
+)
+async def test_preload_startup_platforms(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    ha_version: str,
+    imported: list[list[str]],
+) -> None:
+    """Test the platforms imported during the previous start are preloaded."""
+    hass_storage[bootstrap.STARTUP_PLATFORMS_STORAGE_KEY] = {
+        "version": bootstrap.STARTUP_PLATFORMS_STORAGE_VERSION,
+        "data": {
+            "ha_version": ha_version,
+            "platforms": {
+                "hue": ["light", "removed"],
+                "loaded": ["sensor"],
+                "not_set_up": ["sensor"],
+            },
+        },
+    }
+    hue = Mock(
+        platforms_are_loaded=Mock(return_value=False),
+        platforms_exists=Mock(return_value=["light"]),
+        async_get_platforms=AsyncMock(),
+    )
+    loaded = Mock(
+        platforms_are_loaded=Mock(return_value=True), async_get_platforms=AsyncMock()
+    )
+    store = bootstrap.Store(
+        hass,
+        bootstrap.STARTUP_PLATFORMS_STORAGE_VERSION,
+        bootstrap.STARTUP_PLATFORMS_STORAGE_KEY,
+    )
+
+    await bootstrap._async_preload_startup_platforms(
+        store, {"hue": hue, "loaded": loaded}
+    )
+
+    assert [call.args[0] for call in hue.async_get_platforms.mock_calls] == imported
+    assert loaded.async_get_platforms.mock_calls == []
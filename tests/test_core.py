@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1121,6 +1122,31 @@ def test_state_as_compressed_state_json() -> None:
     assert state.as_compressed_state_json is as_compressed_state
 
 
+async def test_statemachine_shares_attributes_json(hass: HomeAssistant) -> None:
+    """Test states with unchanged attributes share the attributes JSON."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    assert state.attributes_json == b'{"brightness":100}'
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is state.attributes
+    assert new_state.attributes_json is state.attributes_json
+    assert json_loads(new_state.as_dict_json) == json_loads(
+        json_dumps(new_state.as_dict())
+    )
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    changed_state = hass.states.get("light.bowl")
+    assert changed_state.attributes_json == b'{"brightness":50}'
+    assert json_loads(changed_state.as_compressed_state_json.partition(b":")[2]) == {
+        "s": "on",
+        "a": {"brightness": 50},
+        "c": changed_state.context.id,
+        "lc": changed_state.last_changed_timestamp,
+    }
+
+
 async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -1169,6 +1195,72 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events by key."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data)
+
+    listeners = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed(
+        "test", {"entity_id": ["light.kitchen", "light.bed"]}, listener
+    )
+    unsub_device = hass.bus.async_listen_keyed("test", {"device_id": "abc"}, listener)
+    assert hass.bus.async_listeners()["test"] == listeners + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    hass.bus.async_fire("test", {"device_id": "def"})
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": ["light.hall", "light.bed"]})
+    hass.bus.async_fire("test", {"device_id": "abc", "entity_id": "light.hall"})
+    await hass.async_block_till_done()
+    assert calls == [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": ["light.hall", "light.bed"]},
+        {"device_id": "abc", "entity_id": "light.hall"},
+    ]
+
+    # A listener matching multiple keys only runs once
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen", "light.bed"]})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # Comma separated strings are matched like lists
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": "light.hall,light.bed"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall,light.desk"})
+    await hass.async_block_till_done()
+    assert calls == [{"entity_id": "light.hall,light.bed"}]
+
+    calls.clear()
+    unsub_both = hass.bus.async_listen_keyed(
+        "test", {"entity_id": "switch.fan", "device_id": "fan"}, listener
+    )
+    hass.bus.async_fire("test", {"entity_id": "switch.fan", "device_id": "fan"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    unsub_both()
+    calls.clear()
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert calls == [{"device_id": "abc"}]
+
+    unsub_device()
+    assert hass.bus.async_listeners().get("test", 0) == listeners
+    assert not hass.bus._keyed_listeners
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, {"entity_id": "light.kitchen"}, listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []